@@ -126,10 +126,12 @@ def run_web_mode(config_file: Optional[Path] = None, host: str = "127.0.0.1", po
         app = create_app(config_manager)
         
         print(f"🌐 Starting web interface on http://{host}:{port}")
-        uvicorn.run(app, host=host, port=port)
+        
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+        uvicorn.run(app, host=host, port=port, loop="auto", http="auto")
     except ImportError as e:
         print(f"❌ Web dependencies not installed: {e}")
-        print("Install with: pip install fastapi uvicorn")
+        print("Install with: pip install fastapi 'uvicorn[standard]'")
         sys.exit(1)
 
 
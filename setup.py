@@ -46,9 +46,10 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
-        "tui": ["rich>=13.0.0", "textual>=0.41.0"],
+        "tui": ["rich>=13.0.0", "textual>=0.41.0", "uvloop>=0.17.0; sys_platform != 'win32'"],
         "gui": ["PyQt5>=5.15.0"],
-        "web": ["fastapi>=0.104.0", "uvicorn>=0.24.0", "jinja2>=3.1.0"],
+        "web": ["fastapi>=0.108.0", "uvicorn[standard]>=0.24.0", "jinja2>=3.1.0", "orjson>=3.9.0"],
+        "fast-gzip": ["isal>=1.0.0"],
         "dev": [
             "pytest>=7.4.0",
             "pytest-asyncio>=0.21.0",
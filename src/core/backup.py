@@ -4,7 +4,6 @@ Backup operations for PostgreSQL Backup & Restore Tool
 
 import asyncio
 import gzip
-import hashlib
 import shutil
 import subprocess
 import tarfile
@@ -22,9 +21,12 @@ from .models import (
 from .database import DatabaseManager
 from ..utils.logger import get_logger, OperationLogger
 from ..utils.progress import ProgressTracker
+from ..utils.crypto import generate_checksum_async
 
 logger = get_logger(__name__)
 
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 
 class BackupManager:
     """Backup operations manager"""
@@ -190,20 +192,47 @@ class BackupManager:
             # Compress directory
             if config.compression == CompressionType.GZIP:
                 final_file = backup_file.with_suffix(".tar.gz")
-                with tarfile.open(final_file, "w:gz") as tar:
-                    tar.add(temp_backup_dir, arcname=temp_backup_dir.name)
             elif config.compression == CompressionType.BZIP2:
                 final_file = backup_file.with_suffix(".tar.bz2")
-                with tarfile.open(final_file, "w:bz2") as tar:
-                    tar.add(temp_backup_dir, arcname=temp_backup_dir.name)
             else:
-                # No compression - just copy directory
+                # No compression - just archive the directory
                 final_file = backup_file.with_suffix(".tar")
-                with tarfile.open(final_file, "w") as tar:
-                    tar.add(temp_backup_dir, arcname=temp_backup_dir.name)
+            
+            await self._archive_directory(temp_backup_dir, final_file, config.compression)
             
             return final_file
     
+    async def _archive_directory(
+        self,
+        source_dir: Path,
+        archive_file: Path,
+        compression: CompressionType
+    ):
+        """Archive a backup directory with the system tar binary"""
+        
+        tar_flags = {
+            CompressionType.GZIP: "-czf",
+            CompressionType.BZIP2: "-cjf",
+        }.get(compression, "-cf")
+        
+        if shutil.which("tar") is None:
+            # Fall back to tarfile when no tar binary is available
+            mode = {"-czf": "w:gz", "-cjf": "w:bz2"}.get(tar_flags, "w")
+            with tarfile.open(archive_file, mode) as tar:
+                tar.add(source_dir, arcname=source_dir.name)
+            return
+        
+        process = await asyncio.create_subprocess_exec(
+            "tar", tar_flags, str(archive_file),
+            "-C", str(source_dir.parent), source_dir.name,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"tar failed: {stderr.decode()}")
+    
     async def _create_custom_backup(
         self, 
         job: BackupJob, 
@@ -306,13 +335,7 @@ class BackupManager:
     
     async def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum of file"""
-        hash_sha256 = hashlib.sha256()
-        
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        
-        return hash_sha256.hexdigest()
+        return await generate_checksum_async(file_path, 'sha256')
     
     def _get_backup_file_path(self, job: BackupJob) -> Path:
         """Generate backup file path"""
@@ -366,8 +389,16 @@ class BackupManager:
             logger.error(f"Error verifying backup {backup_file}: {e}")
             return False
     
-    async def get_backup_info(self, backup_file: Path) -> Dict[str, Any]:
-        """Get backup file information"""
+    async def get_backup_info(
+        self,
+        backup_file: Path,
+        include_checksum: bool = False
+    ) -> Dict[str, Any]:
+        """Get backup file information
+        
+        The checksum requires reading the whole file, so it is only
+        calculated when ``include_checksum`` is set.
+        """
         try:
             stat = backup_file.stat()
             
@@ -376,10 +407,12 @@ class BackupManager:
                 "size_bytes": stat.st_size,
                 "size_pretty": self._format_size(stat.st_size),
                 "created_time": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "checksum": await self._calculate_checksum(backup_file)
+                "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat()
             }
             
+            if include_checksum:
+                info["checksum"] = await self._calculate_checksum(backup_file)
+            
             # Try to extract additional info based on file type
             if backup_file.suffix in ['.dump', '.dump.gz', '.dump.bz2']:
                 info.update(await self._get_custom_backup_info(backup_file))
@@ -456,11 +489,11 @@ class BackupManager:
     
     def _format_size(self, size_bytes: int) -> str:
         """Format size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} B"
+        # Each unit is 2**10 larger, so the bit length picks the unit directly
+        index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (index * 10)):.1f} {SIZE_UNITS[index]}"
     
     def get_active_backups(self) -> List[BackupResult]:
         """Get list of active backups"""
@@ -4,6 +4,7 @@ Configuration management for PostgreSQL Backup & Restore Tool
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
@@ -19,6 +20,16 @@ class ConfigManager:
         self.app_dir = Path.home() / ".postgres_backup_tool"
         self.app_dir.mkdir(exist_ok=True)
         
+        # Serialises updates coming from web handler threads
+        self._update_lock = threading.Lock()
+        
+        # mtime of the config file as last written by save_config; while it
+        # matches, the file holds exactly the in-memory config
+        self._saved_mtime_ns: Optional[int] = None
+        
+        # Bumped on every update so clients can cheaply detect changes
+        self._revision = 0
+        
         # Load environment variables
         load_dotenv()
         
@@ -89,7 +100,8 @@ class ConfigManager:
                 "debug": False,
                 "secret_key": "change-me-in-production",
                 "cors_origins": ["*"],
-                "max_upload_size": 104857600  # 100MB
+                "max_upload_size": 104857600,  # 100MB
+                "thread_pool_size": 64  # Blocking-call executor threads per worker
             },
             "security": {
                 "encryption_key": None,
@@ -141,11 +153,15 @@ class ConfigManager:
             "POSTGRES_RETENTION_DAYS": ("backup", "retention_days"),
             "POSTGRES_VERIFY_BACKUPS": ("backup", "verify_backups"),
             
+            # Scheduler settings
+            "POSTGRES_MAX_CONCURRENT_JOBS": ("scheduler", "max_concurrent_jobs"),
+            
             # Web settings
             "POSTGRES_WEB_HOST": ("web", "host"),
             "POSTGRES_WEB_PORT": ("web", "port"),
             "POSTGRES_WEB_DEBUG": ("web", "debug"),
             "POSTGRES_SECRET_KEY": ("web", "secret_key"),
+            "POSTGRES_WEB_THREAD_POOL_SIZE": ("web", "thread_pool_size"),
             
             # Security
             "POSTGRES_ENCRYPTION_KEY": ("security", "encryption_key"),
@@ -178,7 +194,8 @@ class ConfigManager:
         if final_key in ["port", "parallel_jobs", "retention_days", "max_log_files", 
                         "connection_timeout", "job_timeout", "retry_attempts", 
                         "retry_delay", "session_timeout", "max_login_attempts", 
-                        "lockout_duration", "max_upload_size"]:
+                        "lockout_duration", "max_upload_size", "max_concurrent_jobs",
+                        "thread_pool_size"]:
             try:
                 current[final_key] = int(value)
             except ValueError:
@@ -192,17 +209,53 @@ class ConfigManager:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4, default=str)
+            # Write a sibling file and rename it so readers never see a
+            # partially written config
+            tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+            
+            # The config holds passwords: keep the existing file's mode and
+            # create new files owner-only
+            try:
+                mode = os.stat(self.config_file).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = 0o600
+            
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    os.chmod(tmp_file, mode)
+                    json.dump(self.config, f, indent=4, default=str)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.config_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp_file)
+                except OSError:
+                    pass
+                raise
+            
+            self._saved_mtime_ns = os.stat(self.config_file).st_mtime_ns
             return True
         except IOError as e:
             print(f"Error saving configuration: {e}")
             return False
     
+    def get_saved_config_file(self) -> Optional[Path]:
+        """Get the config file if it is unchanged since save_config wrote it"""
+        if self._saved_mtime_ns is None:
+            return None
+        try:
+            if os.stat(self.config_file).st_mtime_ns == self._saved_mtime_ns:
+                return self.config_file
+        except OSError:
+            pass
+        return None
+    
     def get_database_config(self, name: str = "source") -> DatabaseConfig:
         """Get database configuration"""
         db_config = self.config["database"].get(name, self.config["database"]["source"])
-        return DatabaseConfig(**db_config)
+        return DatabaseConfig.from_dict(db_config)
     
     def get_backup_config(self) -> BackupConfig:
         """Get backup configuration"""
@@ -279,6 +332,23 @@ class ConfigManager:
     
     def update_config(self, path: str, value: Any):
         """Update configuration value"""
+        self.update_many({path: value})
+    
+    def update_many(self, updates: Dict[str, Any]):
+        """Update several configuration values and save the file once"""
+        with self._update_lock:
+            for path, value in updates.items():
+                self._set_config_value(path, value)
+            self._revision += 1
+            self.save_config()
+    
+    @property
+    def revision(self) -> int:
+        """Number of updates applied since the config was loaded"""
+        return self._revision
+    
+    def _set_config_value(self, path: str, value: Any):
+        """Set a dotted-path value in the in-memory config"""
         keys = path.split('.')
         current = self.config
         
@@ -288,7 +358,6 @@ class ConfigManager:
             current = current[key]
         
         current[keys[-1]] = value
-        self.save_config()
     
     def get_config_value(self, path: str, default: Any = None) -> Any:
         """Get configuration value"""
@@ -3,20 +3,129 @@ Database operations for PostgreSQL Backup & Restore Tool
 """
 
 import asyncio
+import os
+import re
 import subprocess
 import time
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import AsyncIterator, Dict, Final, List, Optional, Tuple, Any
 import asyncpg
-import psycopg2
-from psycopg2.extras import RealDictCursor
 
 from .models import DatabaseConfig, BackupStatus
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# TTLs (seconds) for cached server metadata
+VERSION_CACHE_TTL = 3600
+METADATA_CACHE_TTL = 60
+
+# Connection pool sizing
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = max(10, (os.cpu_count() or 1) * 2 + 1)
+POOL_MAX_QUERIES = 50000
+POOL_MAX_INACTIVE_LIFETIME = 300.0
+MAINT_POOL_MIN_SIZE = 1
+MAINT_POOL_MAX_SIZE = 2
+
+# SQL statements
+_SQL_VERSION: Final = "SELECT version()"
+
+_SQL_DB_SIZE: Final = "SELECT pg_database_size($1)"
+
+_SQL_DB_EXISTS: Final = "SELECT 1 FROM pg_database WHERE datname = $1"
+
+_SQL_TABLE_COUNT: Final = """SELECT COUNT(*) FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.relkind IN ('r', 'p') AND n.nspname = 'public'"""
+
+_SQL_SCHEMA_LIST: Final = """SELECT nspname FROM pg_namespace
+    WHERE nspname NOT IN ('information_schema', 'pg_catalog')
+    AND nspname NOT LIKE 'pg\\_%'
+    ORDER BY nspname"""
+
+_SQL_DB_INFO: Final = """SELECT
+    version() AS version,
+    pg_database_size($1) AS size,
+    (SELECT COUNT(*) FROM pg_class c
+     JOIN pg_namespace n ON n.oid = c.relnamespace
+     WHERE c.relkind IN ('r', 'p') AND n.nspname = 'public') AS table_count,
+    (SELECT COUNT(*) FROM pg_namespace
+     WHERE nspname NOT IN ('information_schema', 'pg_catalog')
+     AND nspname NOT LIKE 'pg\\_%') AS schema_count,
+    (SELECT count(*) FROM pg_stat_activity
+     WHERE datname = $1) AS connection_count"""
+
+_SQL_TABLE_LIST: Final = """SELECT
+    schemaname,
+    tablename,
+    pg_size_pretty(pg_total_relation_size(schemaname||'.'||tablename)) as size,
+    pg_total_relation_size(schemaname||'.'||tablename) as size_bytes
+    FROM pg_tables
+    WHERE schemaname NOT IN ('information_schema', 'pg_catalog')
+    ORDER BY size_bytes DESC"""
+
+_SQL_TABLE_LIST_FAST: Final = """SELECT
+    n.nspname AS schemaname,
+    c.relname AS tablename,
+    pg_size_pretty(c.relpages::bigint * current_setting('block_size')::bigint) as size,
+    c.relpages::bigint * current_setting('block_size')::bigint as size_bytes
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.relkind = 'r'
+    AND n.nspname NOT IN ('information_schema', 'pg_catalog')
+    ORDER BY size_bytes DESC"""
+
+# Hot metadata queries, prepared once per pooled connection
+METADATA_QUERIES = {
+    "version": _SQL_VERSION,
+    "db_size": _SQL_DB_SIZE,
+    "db_exists": _SQL_DB_EXISTS,
+    "table_count": _SQL_TABLE_COUNT,
+    "schema_list": _SQL_SCHEMA_LIST,
+    "database_info": _SQL_DB_INFO,
+}
+
+# Metadata cache shared by all managers:
+# (host, port, username, database, key) -> (expires_at, value)
+# Keyed per role, since what a role can see depends on its privileges
+_metadata_cache: Dict[Tuple[str, int, str, str, str], Tuple[float, Any]] = {}
+
+
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def _quote_ident(name: str) -> str:
+    """Validate and quote a SQL identifier
+    
+    CREATE/DROP DATABASE cannot take bind parameters, so database names are
+    interpolated into the statement. Restricting them to plain identifiers
+    prevents injection and keeps the statement text stable. These statements
+    cannot run inside a transaction block, so behind PgBouncer they need
+    session pooling.
+    """
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid database name: {name!r}")
+    return f'"{name}"'
+
+
+class MetadataConnection(asyncpg.Connection):
+    """Pooled connection carrying prepared metadata statements"""
+    
+    _metadata_stmts: Dict[str, asyncpg.prepared_stmt.PreparedStatement]
+
+
+async def _prepare_metadata_statements(conn: MetadataConnection):
+    """Prepare hot metadata queries when the pool opens a connection"""
+    conn._metadata_stmts = {
+        name: await conn.prepare(query)
+        for name, query in METADATA_QUERIES.items()
+    }
+
 
 class DatabaseManager:
     """Database connection and operations manager"""
@@ -24,15 +133,38 @@ class DatabaseManager:
     def __init__(self, config: DatabaseConfig):
         self.config = config
         self._connection = None
-        self._async_pool = None
     
     def get_connection_string(self) -> str:
         """Get PostgreSQL connection string"""
-        return (
-            f"postgresql://{self.config.username}:{self.config.password}@"
-            f"{self.config.host}:{self.config.port}/{self.config.database}"
-            f"?sslmode={self.config.ssl_mode}"
-        )
+        return self.config.dsn
+    
+    def _cache_key(self, key: str) -> Tuple[str, int, str, str, str]:
+        """Build metadata cache key for this server, role and database"""
+        return (self.config.host, self.config.port, self.config.username, self.config.database, key)
+    
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Get cached metadata value if it has not expired"""
+        entry = _metadata_cache.get(self._cache_key(key))
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            _metadata_cache.pop(self._cache_key(key), None)
+            return None
+        return value
+    
+    def _cache_set(self, key: str, value: Any, ttl: float = METADATA_CACHE_TTL):
+        """Cache metadata value for ttl seconds"""
+        _metadata_cache[self._cache_key(key)] = (time.monotonic() + ttl, value)
+    
+    def invalidate(self, database: Optional[str] = None):
+        """Drop cached metadata for a database (defaults to the configured one)"""
+        target = database or self.config.database
+        for cache_key in list(_metadata_cache):
+            # Every role's view of the database is stale
+            if cache_key[:2] == (self.config.host, self.config.port) and cache_key[3] == target:
+                del _metadata_cache[cache_key]
     
     async def get_async_connection(self) -> asyncpg.Connection:
         """Get async database connection"""
@@ -47,23 +179,17 @@ class DatabaseManager:
         )
     
     async def get_connection_pool(self) -> asyncpg.Pool:
-        """Get async connection pool"""
-        if not self._async_pool:
-            self._async_pool = await asyncpg.create_pool(
-                host=self.config.host,
-                port=self.config.port,
-                database=self.config.database,
-                user=self.config.username,
-                password=self.config.password,
-                ssl=self.config.ssl_mode,
-                command_timeout=self.config.connection_timeout,
-                min_size=2,
-                max_size=10
-            )
-        return self._async_pool
+        """Get async connection pool shared by all managers for this database"""
+        return await db_pool.get_pool(self.config)
+    
+    async def get_maintenance_pool(self) -> asyncpg.Pool:
+        """Get shared connection pool for the postgres maintenance database"""
+        return await db_pool.get_maint_pool(self.config)
     
     def get_sync_connection(self):
         """Get synchronous database connection"""
+        import psycopg2  # lazy import: only the sync path needs psycopg2
+        
         return psycopg2.connect(
             host=self.config.host,
             port=self.config.port,
@@ -75,11 +201,18 @@ class DatabaseManager:
         )
     
     async def test_connection(self) -> Tuple[bool, str]:
-        """Test database connection"""
+        """Test database connection
+        
+        Opens a fresh connection rather than borrowing a pooled one, so the
+        configured credentials and SSL mode are actually checked.
+        """
         try:
             conn = await self.get_async_connection()
-            version = await conn.fetchval("SELECT version()")
-            await conn.close()
+            try:
+                version = await conn.fetchval(_SQL_VERSION)
+            finally:
+                await conn.close()
+            self._cache_set("version", version, VERSION_CACHE_TTL)
             return True, version
         except Exception as e:
             return False, str(e)
@@ -87,6 +220,8 @@ class DatabaseManager:
     def test_connection_sync(self) -> Tuple[bool, str]:
         """Test database connection synchronously"""
         try:
+            from psycopg2.extras import RealDictCursor  # lazy import
+            
             conn = self.get_sync_connection()
             with conn.cursor(cursor_factory=RealDictCursor) as cursor:
                 cursor.execute("SELECT version()")
@@ -96,14 +231,23 @@ class DatabaseManager:
         except Exception as e:
             return False, str(e)
     
+    async def get_version(self) -> Optional[str]:
+        """Get server version string (cached)"""
+        version = self._cache_get("version")
+        if version is not None:
+            return version
+        
+        success, result = await self.test_connection()
+        return result if success else None
+    
     async def get_database_size(self) -> int:
         """Get database size in bytes"""
         try:
-            conn = await self.get_async_connection()
-            size = await conn.fetchval(
-                "SELECT pg_database_size($1)", self.config.database
-            )
-            await conn.close()
+            pool = await self.get_connection_pool()
+            async with pool.acquire() as conn:
+                size = await conn._metadata_stmts["db_size"].fetchval(
+                    self.config.database
+                )
             return size
         except Exception as e:
             logger.error(f"Error getting database size: {e}")
@@ -112,48 +256,81 @@ class DatabaseManager:
     async def get_table_count(self) -> int:
         """Get table count"""
         try:
-            conn = await self.get_async_connection()
-            count = await conn.fetchval(
-                """SELECT COUNT(*) FROM information_schema.tables 
-                   WHERE table_schema = 'public'"""
-            )
-            await conn.close()
+            pool = await self.get_connection_pool()
+            async with pool.acquire() as conn:
+                count = await conn._metadata_stmts["table_count"].fetchval()
             return count
         except Exception as e:
             logger.error(f"Error getting table count: {e}")
             return 0
     
-    async def get_table_list(self) -> List[Dict[str, Any]]:
-        """Get list of tables with sizes"""
+    async def get_table_list(self, fast: bool = False) -> List[asyncpg.Record]:
+        """Get list of tables with sizes
+        
+        Rows are returned as asyncpg records, which support mapping access
+        (``row["tablename"]``, ``row.get()``, ``row.items()``); use
+        ``dict(row)`` where a mutable copy is needed.
+        
+        With ``fast`` the sizes are estimated from ``pg_class.relpages``
+        instead of ``pg_total_relation_size``, which avoids walking every
+        fork of every relation on databases with many partitions/chunks.
+        Estimated sizes exclude indexes and TOAST data.
+        """
+        cache_key = "table_list_fast" if fast else "table_list"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        query = _SQL_TABLE_LIST_FAST if fast else _SQL_TABLE_LIST
+        
         try:
-            conn = await self.get_async_connection()
-            tables = await conn.fetch(
-                """SELECT 
-                   schemaname,
-                   tablename,
-                   pg_size_pretty(pg_total_relation_size(schemaname||'.'||tablename)) as size,
-                   pg_total_relation_size(schemaname||'.'||tablename) as size_bytes
-                   FROM pg_tables 
-                   WHERE schemaname NOT IN ('information_schema', 'pg_catalog')
-                   ORDER BY size_bytes DESC"""
-            )
-            await conn.close()
-            return [dict(table) for table in tables]
+            pool = await self.get_connection_pool()
+            async with pool.acquire() as conn:
+                tables = await conn.fetch(query)
+            self._cache_set(cache_key, tables)
+            return tables
         except Exception as e:
             logger.error(f"Error getting table list: {e}")
             return []
     
+    async def iter_table_list(self, fast: bool = False) -> AsyncIterator[asyncpg.Record]:
+        """Stream tables with sizes without materializing the full list
+        
+        Intended for exports of databases with thousands of tables; rows are
+        fetched through a server-side cursor so client memory stays bounded.
+        Results are not cached.
+        """
+        query = _SQL_TABLE_LIST_FAST if fast else _SQL_TABLE_LIST
+        
+        pool = await self.get_connection_pool()
+        async with pool.acquire() as conn:
+            # Cursors require a transaction
+            async with conn.transaction():
+                async for table in conn.cursor(query):
+                    yield table
+    
+    async def get_table_summary(self, fast: bool = False) -> Tuple[List[asyncpg.Record], int]:
+        """Get list of tables with sizes and the total table count
+        
+        Dashboards that need both should use this instead of calling
+        get_table_list and get_table_count separately.
+        """
+        tables = await self.get_table_list(fast=fast)
+        return tables, len(tables)
+    
     async def get_schema_list(self) -> List[str]:
         """Get list of schemas"""
+        cached = self._cache_get("schema_list")
+        if cached is not None:
+            return cached
+        
         try:
-            conn = await self.get_async_connection()
-            schemas = await conn.fetch(
-                """SELECT schema_name FROM information_schema.schemata
-                   WHERE schema_name NOT IN ('information_schema', 'pg_catalog')
-                   ORDER BY schema_name"""
-            )
-            await conn.close()
-            return [schema["schema_name"] for schema in schemas]
+            pool = await self.get_connection_pool()
+            async with pool.acquire() as conn:
+                schemas = await conn._metadata_stmts["schema_list"].fetch()
+            schema_list = [schema["nspname"] for schema in schemas]
+            self._cache_set("schema_list", schema_list)
+            return schema_list
         except Exception as e:
             logger.error(f"Error getting schema list: {e}")
             return []
@@ -161,11 +338,11 @@ class DatabaseManager:
     async def database_exists(self, database_name: str) -> bool:
         """Check if database exists"""
         try:
-            conn = await self.get_async_connection()
-            exists = await conn.fetchval(
-                "SELECT 1 FROM pg_database WHERE datname = $1", database_name
-            )
-            await conn.close()
+            pool = await self.get_maintenance_pool()
+            async with pool.acquire() as conn:
+                exists = await conn._metadata_stmts["db_exists"].fetchval(
+                    database_name
+                )
             return bool(exists)
         except Exception as e:
             logger.error(f"Error checking if database exists: {e}")
@@ -174,15 +351,12 @@ class DatabaseManager:
     async def create_database(self, database_name: str) -> bool:
         """Create new database"""
         try:
-            # Connect to postgres database to create new database
-            temp_config = self.config.copy()
-            temp_config.database = "postgres"
-            temp_manager = DatabaseManager(temp_config)
-            
-            conn = await temp_manager.get_async_connection()
-            await conn.execute(f'CREATE DATABASE "{database_name}"')
-            await conn.close()
+            # Use the postgres maintenance database to create database
+            pool = await self.get_maintenance_pool()
+            async with pool.acquire() as conn:
+                await conn.execute(f'CREATE DATABASE {_quote_ident(database_name)}')
             
+            self.invalidate(database_name)
             logger.info(f"Database {database_name} created successfully")
             return True
         except Exception as e:
@@ -192,15 +366,15 @@ class DatabaseManager:
     async def drop_database(self, database_name: str) -> bool:
         """Drop database"""
         try:
-            # Connect to postgres database to drop database
-            temp_config = self.config.copy()
-            temp_config.database = "postgres"
-            temp_manager = DatabaseManager(temp_config)
+            # Idle pooled connections would block DROP DATABASE
+            await db_pool.close_pool(replace(self.config, database=database_name))
             
-            conn = await temp_manager.get_async_connection()
-            await conn.execute(f'DROP DATABASE IF EXISTS "{database_name}"')
-            await conn.close()
+            # Use the postgres maintenance database to drop database
+            pool = await self.get_maintenance_pool()
+            async with pool.acquire() as conn:
+                await conn.execute(f'DROP DATABASE IF EXISTS {_quote_ident(database_name)}')
             
+            self.invalidate(database_name)
             logger.info(f"Database {database_name} dropped successfully")
             return True
         except Exception as e:
@@ -210,41 +384,20 @@ class DatabaseManager:
     async def get_database_info(self) -> Dict[str, Any]:
         """Get comprehensive database information"""
         try:
-            conn = await self.get_async_connection()
-            
-            # Basic info
-            version = await conn.fetchval("SELECT version()")
-            size = await conn.fetchval(
-                "SELECT pg_database_size($1)", self.config.database
-            )
-            
-            # Table count
-            table_count = await conn.fetchval(
-                """SELECT COUNT(*) FROM information_schema.tables 
-                   WHERE table_schema = 'public'"""
-            )
-            
-            # Schema count
-            schema_count = await conn.fetchval(
-                """SELECT COUNT(*) FROM information_schema.schemata
-                   WHERE schema_name NOT IN ('information_schema', 'pg_catalog')"""
-            )
-            
-            # Connection count
-            connection_count = await conn.fetchval(
-                "SELECT count(*) FROM pg_stat_activity WHERE datname = $1",
-                self.config.database
-            )
-            
-            await conn.close()
+            pool = await self.get_connection_pool()
+            async with pool.acquire() as conn:
+                # Fetch everything in a single round-trip
+                row = await conn._metadata_stmts["database_info"].fetchrow(
+                    self.config.database
+                )
             
             return {
-                "version": version,
-                "size_bytes": size,
-                "size_pretty": self._format_size(size),
-                "table_count": table_count,
-                "schema_count": schema_count,
-                "connection_count": connection_count,
+                "version": row["version"],
+                "size_bytes": row["size"],
+                "size_pretty": self._format_size(row["size"]),
+                "table_count": row["table_count"],
+                "schema_count": row["schema_count"],
+                "connection_count": row["connection_count"],
                 "last_checked": datetime.now().isoformat()
             }
         except Exception as e:
@@ -253,49 +406,116 @@ class DatabaseManager:
     
     def _format_size(self, size_bytes: int) -> str:
         """Format size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} B"
+        # Each unit is 2**10 larger, so the bit length picks the unit directly
+        index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (index * 10)):.1f} {SIZE_UNITS[index]}"
     
     async def close(self):
-        """Close connections"""
-        if self._async_pool:
-            await self._async_pool.close()
-            self._async_pool = None
+        """Close connections
+        
+        Pools are shared through ``db_pool`` and closed with
+        ``db_pool.close_all()`` on application shutdown.
+        """
+        if self._connection:
+            self._connection.close()
+            self._connection = None
 
 
 class DatabasePool:
     """Database connection pool manager"""
     
     def __init__(self):
-        self.pools: Dict[str, asyncpg.Pool] = {}
+        # Keyed on the whole frozen config, so a changed password or SSL
+        # mode never reuses connections opened with the old settings
+        self.pools: Dict[Tuple[str, DatabaseConfig], asyncpg.Pool] = {}
+        
+        # One lock per pool key, so concurrent callers create a pool once
+        self._locks: Dict[Tuple[str, DatabaseConfig], asyncio.Lock] = {}
+    
+    def _pool_key(self, config: DatabaseConfig) -> Tuple[str, DatabaseConfig]:
+        """Get pool key for database config"""
+        return ("db", config)
+    
+    def _maint_pool_key(self, config: DatabaseConfig) -> Tuple[str, DatabaseConfig]:
+        """Get maintenance pool key for database config"""
+        return ("maint", replace(config, database="postgres"))
+    
+    async def _get_or_create_pool(self, pool_key: Tuple[str, DatabaseConfig], **pool_kwargs) -> asyncpg.Pool:
+        """Return the pool for a key, creating it at most once"""
+        pool = self.pools.get(pool_key)
+        if pool is not None:
+            return pool
+        
+        lock = self._locks.setdefault(pool_key, asyncio.Lock())
+        async with lock:
+            pool = self.pools.get(pool_key)
+            if pool is None:
+                pool = await self._create_pool(pool_key[1], **pool_kwargs)
+                self.pools[pool_key] = pool
+        return pool
+    
+    async def _create_pool(
+        self,
+        config: DatabaseConfig,
+        min_size: int = POOL_MIN_SIZE,
+        max_size: int = POOL_MAX_SIZE
+    ) -> asyncpg.Pool:
+        """Create a connection pool for database config"""
+        return await asyncpg.create_pool(
+            host=config.host,
+            port=config.port,
+            database=config.database,
+            user=config.username,
+            password=config.password,
+            ssl=config.ssl_mode,
+            command_timeout=config.connection_timeout,
+            min_size=min_size,
+            max_size=max_size,
+            max_queries=POOL_MAX_QUERIES,
+            max_inactive_connection_lifetime=POOL_MAX_INACTIVE_LIFETIME,
+            # Startup parameters survive the RESET ALL run on pool release
+            server_settings={"jit": "off"},
+            connection_class=MetadataConnection,
+            init=_prepare_metadata_statements
+        )
     
     async def get_pool(self, config: DatabaseConfig) -> asyncpg.Pool:
         """Get or create connection pool for database config"""
-        pool_key = f"{config.host}:{config.port}:{config.database}"
-        
-        if pool_key not in self.pools:
-            self.pools[pool_key] = await asyncpg.create_pool(
-                host=config.host,
-                port=config.port,
-                database=config.database,
-                user=config.username,
-                password=config.password,
-                ssl=config.ssl_mode,
-                command_timeout=config.connection_timeout,
-                min_size=2,
-                max_size=10
-            )
+        return await self._get_or_create_pool(self._pool_key(config))
+    
+    async def get_maint_pool(self, config: DatabaseConfig) -> asyncpg.Pool:
+        """Get or create small pool on the postgres maintenance database
         
-        return self.pools[pool_key]
+        Used for admin operations (CREATE/DROP DATABASE, existence checks)
+        which only ever need one or two connections.
+        """
+        return await self._get_or_create_pool(
+            self._maint_pool_key(config),
+            min_size=MAINT_POOL_MIN_SIZE,
+            max_size=MAINT_POOL_MAX_SIZE
+        )
+    
+    async def close_pool(self, config: DatabaseConfig):
+        """Close connection pool for database config if one exists"""
+        pool = self.pools.pop(self._pool_key(config), None)
+        if pool:
+            await pool.close()
+    
+    async def close_pools_for(self, config: DatabaseConfig):
+        """Close the regular and maintenance pools opened with a config"""
+        for pool_key in (self._pool_key(config), self._maint_pool_key(config)):
+            pool = self.pools.pop(pool_key, None)
+            if pool:
+                await pool.close()
     
     async def close_all(self):
         """Close all connection pools"""
-        for pool in self.pools.values():
-            await pool.close()
+        pools = list(self.pools.values())
         self.pools.clear()
+        for pool in pools:
+            await pool.close()
 
 
 # Global database pool instance
@@ -2,11 +2,38 @@
 Data models for PostgreSQL Backup & Restore Tool
 """
 
+import asyncio
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Union
+from pydantic import BaseModel, Field, field_serializer, validator
+
+
+# Timestamp shared by everything created in the current event-loop tick
+_now_cache: Dict[str, datetime] = {}
+
+
+def _now_cached() -> datetime:
+    """Get current time, reusing one value per event-loop tick
+    
+    Objects built together in a burst (e.g. a bulk job import) share a
+    timestamp instead of each calling datetime.now(). Outside a running
+    event loop this is plain datetime.now().
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return datetime.now()
+    
+    now = _now_cache.get("now")
+    if now is None:
+        now = _now_cache["now"] = datetime.now()
+        # Expire once control returns to the event loop
+        loop.call_soon(_now_cache.clear)
+    return now
 
 
 class BackupType(str, Enum):
@@ -35,21 +62,51 @@ class BackupStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class DatabaseConfig(BaseModel):
-    """Database connection configuration"""
-    host: str = Field(..., description="Database host")
-    port: int = Field(5432, description="Database port")
-    database: str = Field(..., description="Database name")
-    username: str = Field(..., description="Database username")
-    password: str = Field(..., description="Database password")
-    ssl_mode: str = Field("prefer", description="SSL mode")
-    connection_timeout: int = Field(30, description="Connection timeout in seconds")
+@dataclass(frozen=True)
+class DatabaseConfig:
+    """Database connection configuration
+    
+    A frozen dataclass rather than a pydantic model: it is constructed on
+    every database operation and pool lookup, so it skips model validation
+    and can be hashed and shared safely.
+    """
+    host: str  # Database host
+    database: str  # Database name
+    username: str  # Database username
+    password: str  # Database password
+    port: int = 5432  # Database port
+    ssl_mode: str = "prefer"  # SSL mode
+    connection_timeout: int = 30  # Connection timeout in seconds
     
-    @validator('port')
-    def validate_port(cls, v):
-        if not 1 <= v <= 65535:
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "DatabaseConfig":
+        """Build from a config mapping, ignoring keys that are not fields"""
+        return cls(**{key: value for key, value in data.items() if key in _DATABASE_CONFIG_FIELDS})
+    
+    def __post_init__(self):
+        # Config files and environment variables may provide numbers as strings
+        object.__setattr__(self, "port", int(self.port))
+        object.__setattr__(self, "connection_timeout", int(self.connection_timeout))
+        
+        if not 1 <= self.port <= 65535:
             raise ValueError('Port must be between 1 and 65535')
-        return v
+    
+    @cached_property
+    def dsn(self) -> str:
+        """PostgreSQL connection string (computed once per config)"""
+        return (
+            f"postgresql://{self.username}:{self.password}@"
+            f"{self.host}:{self.port}/{self.database}"
+            f"?sslmode={self.ssl_mode}"
+        )
+    
+    def dict(self) -> Dict[str, Union[str, int]]:
+        """Get configuration as a dictionary"""
+        return asdict(self)
+
+
+# Field names accepted by DatabaseConfig.from_dict
+_DATABASE_CONFIG_FIELDS = frozenset(field.name for field in fields(DatabaseConfig))
 
 
 class BackupConfig(BaseModel):
@@ -59,10 +116,10 @@ class BackupConfig(BaseModel):
     encryption: EncryptionType = Field(EncryptionType.NONE, description="Encryption type")
     encryption_key: Optional[str] = Field(None, description="Encryption key")
     parallel_jobs: int = Field(4, description="Number of parallel jobs")
-    exclude_schemas: List[str] = Field(default_factory=list, description="Schemas to exclude")
-    include_schemas: List[str] = Field(default_factory=list, description="Schemas to include")
-    exclude_tables: List[str] = Field(default_factory=list, description="Tables to exclude")
-    include_tables: List[str] = Field(default_factory=list, description="Tables to include")
+    exclude_schemas: FrozenSet[str] = Field(default_factory=frozenset, description="Schemas to exclude")
+    include_schemas: FrozenSet[str] = Field(default_factory=frozenset, description="Schemas to include")
+    exclude_tables: FrozenSet[str] = Field(default_factory=frozenset, description="Tables to exclude")
+    include_tables: FrozenSet[str] = Field(default_factory=frozenset, description="Tables to include")
     verbose: bool = Field(True, description="Verbose output")
     clean_before_restore: bool = Field(True, description="Clean objects before restore")
     no_owner: bool = Field(True, description="Skip owner commands")
@@ -73,6 +130,11 @@ class BackupConfig(BaseModel):
         if v < 1:
             raise ValueError('Parallel jobs must be at least 1')
         return v
+    
+    @field_serializer('exclude_schemas', 'include_schemas', 'exclude_tables', 'include_tables')
+    def serialize_name_sets(self, v):
+        # Keep config and job files as plain, stable JSON lists
+        return sorted(v)
 
 
 class BackupJob(BaseModel):
@@ -85,8 +147,8 @@ class BackupJob(BaseModel):
     schedule: Optional[str] = Field(None, description="Cron schedule expression")
     retention_days: int = Field(30, description="Retention period in days")
     enabled: bool = Field(True, description="Job enabled status")
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
+    created_at: datetime = Field(default_factory=_now_cached, description="Creation timestamp")
+    updated_at: datetime = Field(default_factory=_now_cached, description="Last update timestamp")
     
     class Config:
         json_encoders = {
@@ -107,7 +169,9 @@ class BackupResult(BaseModel):
     tables_count: int = Field(0, description="Number of tables")
     error_message: Optional[str] = Field(None, description="Error message if failed")
     checksum: Optional[str] = Field(None, description="Backup file checksum")
-    metadata: Dict[str, Union[str, int, bool]] = Field(default_factory=dict, description="Additional metadata")
+    # Any-typed so nested metadata (e.g. database_info) is stored as-is
+    # instead of being validated value by value against a Union
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
     @property
     def duration(self) -> Optional[float]:
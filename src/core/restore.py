@@ -3,15 +3,17 @@ Restore operations for PostgreSQL Backup & Restore Tool
 """
 
 import asyncio
-import gzip
+import os
+import posixpath
+import re
 import shutil
-import subprocess
 import tarfile
 import tempfile
+import zlib
+from collections import Counter, deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
-import threading
+from typing import Deque, Dict, List, Optional, Callable, Any
 import time
 
 from .models import (
@@ -19,10 +21,70 @@ from .models import (
 )
 from .database import DatabaseManager
 from ..utils.logger import get_logger, OperationLogger
-from ..utils.progress import ProgressTracker
 
 logger = get_logger(__name__)
 
+# Prefer ISA-L or zlib-ng accelerated gzip when installed
+try:
+    from isal import igzip as _gzip_mod
+except ImportError:
+    try:
+        from zlib_ng import gzip_ng as _gzip_mod
+    except ImportError:
+        import gzip as _gzip_mod
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Upper bound on parallel pg_restore workers, on top of the configured
+# backup.parallel_jobs; each worker is a server connection
+MAX_RESTORE_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+# maintenance_work_mem shared by all workers of one restore, with a floor
+# per connection
+RESTORE_MAINTENANCE_WORK_MEM_MB = 1024
+MIN_MAINTENANCE_WORK_MEM_MB = 64
+
+# Session settings applied to every restore connection
+RESTORE_PGOPTIONS = "-c synchronous_commit=off"
+
+# Copy buffer used when extracting directory-format archives
+TAR_COPY_BUFSIZE = 1024 * 1024
+
+# Verbose pg_restore output lines that mark a TOC item being restored. A
+# serial restore logs each item as it starts; a parallel one also logs
+# "finished item" for it, so only those lines are counted there
+_PG_RESTORE_ITEM_PATTERN = re.compile(rb"pg_restore: (creating |processing data )")
+_PG_RESTORE_FINISHED_PATTERN = re.compile(rb"pg_restore: finished item ")
+
+# Object keywords counted in TOC listings and SQL headers. Longer
+# alternatives come first and word boundaries keep TABLESPACE out of TABLE
+_TOC_PATTERN = re.compile(
+    rb"\b(CREATE TABLE|CREATE INDEX|CREATE TRIGGER|TABLE|FUNCTION|TRIGGER)\b"
+)
+
+
+def _toc_dir_of(member: tarfile.TarInfo) -> Optional[str]:
+    """Return the directory of a toc.dat archive member, or None for other members"""
+    # Drop a "./" prefix (and any leading "/") without touching
+    # dot-directories such as ".hidden/"
+    name = posixpath.normpath(member.name).lstrip("/")
+    if member.isfile() and (name == "toc.dat" or name.endswith("/toc.dat")):
+        return os.path.dirname(name)
+    return None
+
+
+def _count_keywords(content: bytes) -> Counter:
+    """Count TOC keywords in a single pass over raw bytes"""
+    return Counter(_TOC_PATTERN.findall(content))
+
+
+def _count_toc_entries(listing: bytes) -> int:
+    """Count the items in pg_restore --list output, skipping ";" comments"""
+    return sum(
+        1 for line in listing.splitlines()
+        if line.strip() and not line.lstrip().startswith(b";")
+    )
+
 
 class RestoreManager:
     """Restore operations manager"""
@@ -31,6 +93,8 @@ class RestoreManager:
         self.config_manager = config_manager
         self.active_restores: Dict[str, RestoreResult] = {}
         self.progress_callbacks: Dict[str, Callable] = {}
+        self.progress_totals: Dict[str, int] = {}
+        self.restore_jobs: Dict[str, int] = {}
     
     async def restore_backup(
         self,
@@ -52,6 +116,7 @@ class RestoreManager:
         self.active_restores[restore_id] = result
         if progress_callback:
             self.progress_callbacks[restore_id] = progress_callback
+        self.restore_jobs[restore_id] = self._restore_job_count(backup_config)
         
         try:
             with OperationLogger(logger, f"restore from {backup_file}"):
@@ -62,6 +127,7 @@ class RestoreManager:
                 
                 # Get backup info
                 backup_info = await self._get_backup_info(backup_file)
+                self.progress_totals[restore_id] = backup_info.get("toc_entries", 0)
                 
                 # Check if target database exists
                 db_manager = DatabaseManager(target_config)
@@ -108,9 +174,16 @@ class RestoreManager:
                 del self.active_restores[restore_id]
             if restore_id in self.progress_callbacks:
                 del self.progress_callbacks[restore_id]
+            self.progress_totals.pop(restore_id, None)
+            self.restore_jobs.pop(restore_id, None)
         
         return result
     
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        """Run blocking file I/O in the default executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+    
     async def _verify_backup_file(self, backup_file: Path) -> bool:
         """Verify backup file integrity"""
         try:
@@ -118,8 +191,14 @@ class RestoreManager:
             if not backup_file.exists():
                 return False
             
+            name = backup_file.name
+            
             # For custom format backups, use pg_restore --list
-            if backup_file.suffix in ['.dump', '.dump.gz', '.dump.bz2']:
+            if name.endswith(('.dump', '.dump.gz', '.dump.bz2')):
+                # Compressed backups must start with a valid gzip stream
+                if name.endswith('.gz') and not await self._run_blocking(self._gzip_header_ok, backup_file):
+                    return False
+                
                 cmd = ["pg_restore", "--list", str(backup_file)]
                 process = await asyncio.create_subprocess_exec(
                     *cmd,
@@ -129,34 +208,56 @@ class RestoreManager:
                 await process.wait()
                 return process.returncode == 0
             
-            # For tar archives, check if they can be opened
-            elif backup_file.suffix in ['.tar', '.tar.gz', '.tar.bz2']:
-                try:
-                    with tarfile.open(backup_file, 'r:*') as tar:
-                        tar.getmembers()
-                    return True
-                except:
-                    return False
-            
-            # For SQL files, check if they're readable
-            elif backup_file.suffix in ['.sql', '.sql.gz']:
-                try:
-                    if backup_file.suffix == '.sql.gz':
-                        with gzip.open(backup_file, 'rt') as f:
-                            f.read(1024)  # Read first 1KB
-                    else:
-                        with open(backup_file, 'r') as f:
-                            f.read(1024)
-                    return True
-                except:
-                    return False
-            
-            return False
+            return await self._run_blocking(self._verify_backup_file_sync, backup_file)
             
         except Exception as e:
             logger.error(f"Error verifying backup {backup_file}: {e}")
             return False
     
+    def _verify_backup_file_sync(self, backup_file: Path) -> bool:
+        """Verify archive and SQL backups that need only local file reads"""
+        name = backup_file.name
+        
+        # Compressed backups must start with a valid gzip stream
+        if name.endswith('.gz') and not self._gzip_header_ok(backup_file):
+            return False
+        
+        # For tar archives, check if they can be opened
+        if name.endswith(('.tar', '.tar.gz', '.tar.bz2')):
+            try:
+                with tarfile.open(backup_file, 'r:*') as tar:
+                    tar.getmembers()
+                return True
+            except:
+                return False
+        
+        # For SQL files, check if they're readable
+        elif name.endswith('.sql.gz'):
+            # The gzip header check above already decoded the first block
+            return True
+        
+        elif name.endswith('.sql'):
+            try:
+                with open(backup_file, 'rb') as f:
+                    f.read(1024)
+                return True
+            except:
+                return False
+        
+        return False
+    
+    def _gzip_header_ok(self, backup_file: Path) -> bool:
+        """Check the gzip magic and inflate only the first 64 KB"""
+        try:
+            with open(backup_file, 'rb') as f:
+                head = f.read(65536)
+            if head[:2] != GZIP_MAGIC:
+                return False
+            zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head)
+            return True
+        except (OSError, zlib.error):
+            return False
+    
     async def _get_backup_info(self, backup_file: Path) -> Dict[str, Any]:
         """Get backup file information"""
         try:
@@ -170,11 +271,12 @@ class RestoreManager:
             }
             
             # Try to extract additional info based on file type
-            if backup_file.suffix in ['.dump', '.dump.gz', '.dump.bz2']:
+            name = backup_file.name
+            if name.endswith(('.dump', '.dump.gz', '.dump.bz2')):
                 info.update(await self._get_custom_backup_info(backup_file))
-            elif backup_file.suffix in ['.tar', '.tar.gz', '.tar.bz2']:
+            elif name.endswith(('.tar', '.tar.gz', '.tar.bz2')):
                 info.update(await self._get_tar_backup_info(backup_file))
-            elif backup_file.suffix in ['.sql', '.sql.gz']:
+            elif name.endswith(('.sql', '.sql.gz')):
                 info.update(await self._get_sql_backup_info(backup_file))
             
             return info
@@ -195,12 +297,13 @@ class RestoreManager:
             stdout, _ = await process.communicate()
             
             if process.returncode == 0:
-                content = stdout.decode()
+                counts = _count_keywords(stdout)
                 return {
                     "format": "custom",
-                    "tables_count": content.count("TABLE"),
-                    "functions_count": content.count("FUNCTION"),
-                    "triggers_count": content.count("TRIGGER")
+                    "tables_count": counts[b"TABLE"],
+                    "functions_count": counts[b"FUNCTION"],
+                    "triggers_count": counts[b"TRIGGER"],
+                    "toc_entries": _count_toc_entries(stdout)
                 }
         except:
             pass
@@ -209,26 +312,26 @@ class RestoreManager:
     
     async def _get_tar_backup_info(self, backup_file: Path) -> Dict[str, Any]:
         """Get tar backup info"""
+        return await self._run_blocking(self._get_tar_backup_info_sync, backup_file)
+    
+    def _get_tar_backup_info_sync(self, backup_file: Path) -> Dict[str, Any]:
+        """Read directory backup info from the archive's toc.dat"""
         try:
-            with tarfile.open(backup_file, 'r:*') as tar:
-                members = tar.getmembers()
-                
-                # Look for toc.dat file to get table count
+            # Stream members and stop at toc.dat instead of indexing the
+            # whole (possibly compressed) archive
+            with tarfile.open(backup_file, 'r|*') as tar:
                 table_count = 0
-                for member in members:
+                for member in tar:
                     if member.name.endswith('toc.dat'):
                         try:
-                            content = tar.extractfile(member).read().decode('utf-8', errors='ignore')
-                            table_count = content.count("TABLE")
-                            break
+                            table_count = _count_keywords(tar.extractfile(member).read())[b"TABLE"]
                         except:
                             pass
+                        break
                 
                 return {
                     "format": "directory",
-                    "files_count": len(members),
-                    "tables_count": table_count,
-                    "uncompressed_size": sum(m.size for m in members)
+                    "tables_count": table_count
                 }
         except:
             pass
@@ -237,19 +340,25 @@ class RestoreManager:
     
     async def _get_sql_backup_info(self, backup_file: Path) -> Dict[str, Any]:
         """Get SQL backup info"""
+        return await self._run_blocking(self._get_sql_backup_info_sync, backup_file)
+    
+    def _get_sql_backup_info_sync(self, backup_file: Path) -> Dict[str, Any]:
+        """Count objects declared in the first 10 KB of a SQL dump"""
         try:
-            if backup_file.suffix == '.sql.gz':
-                with gzip.open(backup_file, 'rt') as f:
+            # Read raw bytes so dumps in any client encoding can be probed
+            if backup_file.name.endswith('.sql.gz'):
+                with _gzip_mod.open(backup_file, 'rb') as f:
                     content = f.read(10240)  # Read first 10KB
             else:
-                with open(backup_file, 'r') as f:
+                with open(backup_file, 'rb') as f:
                     content = f.read(10240)
             
+            counts = _count_keywords(content)
             return {
                 "format": "sql",
-                "tables_count": content.count("CREATE TABLE"),
-                "indexes_count": content.count("CREATE INDEX"),
-                "triggers_count": content.count("CREATE TRIGGER")
+                "tables_count": counts[b"CREATE TABLE"],
+                "indexes_count": counts[b"CREATE INDEX"],
+                "triggers_count": counts[b"CREATE TRIGGER"]
             }
         except:
             pass
@@ -268,6 +377,30 @@ class RestoreManager:
         logger.warning(f"Database {target_config.database} already exists, dropping it")
         return await db_manager.drop_database(target_config.database)
     
+    def _restore_job_count(self, backup_config: Optional[BackupConfig]) -> int:
+        """Parallel pg_restore workers: the configured parallel_jobs, capped"""
+        if backup_config is not None:
+            configured = backup_config.parallel_jobs
+        else:
+            configured = self.config_manager.get_config_value("backup.parallel_jobs", 4)
+        return max(1, min(int(configured), MAX_RESTORE_JOBS))
+    
+    def _restore_env(self, target_config: DatabaseConfig, jobs: int = 1) -> Dict[str, str]:
+        """Build the environment for pg_restore/psql child processes"""
+        env = os.environ.copy()
+        env["PGPASSWORD"] = target_config.password
+        
+        # Split the maintenance_work_mem budget across the worker connections
+        work_mem_mb = max(MIN_MAINTENANCE_WORK_MEM_MB, RESTORE_MAINTENANCE_WORK_MEM_MB // jobs)
+        
+        # Session settings for the restore connections; anything the user
+        # already put in PGOPTIONS comes later and takes precedence
+        env["PGOPTIONS"] = (
+            f"{RESTORE_PGOPTIONS} -c maintenance_work_mem={work_mem_mb}MB "
+            f"{env.get('PGOPTIONS', '')}"
+        ).strip()
+        return env
+    
     async def _restore_custom_format(
         self, 
         backup_file: Path, 
@@ -277,6 +410,7 @@ class RestoreManager:
     ):
         """Restore from custom format backup"""
         
+        jobs = self.restore_jobs.get(restore_id, 1)
         cmd = [
             "pg_restore",
             f"-h{target_config.host}",
@@ -287,10 +421,11 @@ class RestoreManager:
             "--clean",
             "--no-owner",
             "--no-privileges",
+            f"--jobs={jobs}",
             str(backup_file)
         ]
         
-        env = {"PGPASSWORD": target_config.password}
+        env = self._restore_env(target_config, jobs)
         
         process = await asyncio.create_subprocess_exec(
             *cmd,
@@ -299,11 +434,12 @@ class RestoreManager:
             stderr=asyncio.subprocess.PIPE
         )
         
-        await self._monitor_restore_process(process, restore_id, "Restoring custom format backup")
+        stderr = await self._monitor_restore_process(
+            process, restore_id, "Restoring custom format backup", jobs
+        )
         
         if process.returncode != 0:
-            stderr = await process.stderr.read()
-            raise RuntimeError(f"pg_restore failed: {stderr.decode()}")
+            raise RuntimeError(f"pg_restore failed: {stderr}")
     
     async def _restore_directory_format(
         self, 
@@ -314,17 +450,33 @@ class RestoreManager:
     ):
         """Restore from directory format backup"""
         
+        # Only an uncompressed archive is worth scanning up front: if it is a
+        # plain pg_dump tar-format archive it needs no extraction at all.
+        # Compressed archives are scanned while they are being extracted.
+        toc_dir = None
+        if backup_file.suffix == ".tar":
+            toc_dir = await self._run_blocking(self._find_toc_dir, backup_file)
+        jobs = 1
+        
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract tar archive
-            with tarfile.open(backup_file, 'r:*') as tar:
-                tar.extractall(temp_dir)
-            
-            # Find the extracted directory
-            extracted_dirs = [d for d in Path(temp_dir).iterdir() if d.is_dir()]
-            if not extracted_dirs:
-                raise RuntimeError("No backup directory found in archive")
-            
-            backup_dir = extracted_dirs[0]
+            if toc_dir == "":
+                # A plain pg_dump tar-format archive can be read by pg_restore
+                # directly, without extracting it first
+                restore_source = backup_file
+                format_args = ["--format=tar"]
+                self.progress_totals[restore_id] = await self._list_toc_entries(
+                    restore_source, format_args
+                )
+            else:
+                toc_dir = await self._run_blocking(self._extract_archive, backup_file, Path(temp_dir))
+                
+                if toc_dir is None:
+                    raise RuntimeError("No backup directory found in archive")
+                
+                restore_source = Path(temp_dir) / toc_dir
+                self.progress_totals[restore_id] = await self._list_toc_entries(restore_source)
+                jobs = self.restore_jobs.get(restore_id, 1)
+                format_args = [f"--jobs={jobs}"]
             
             cmd = [
                 "pg_restore",
@@ -336,11 +488,11 @@ class RestoreManager:
                 "--clean",
                 "--no-owner",
                 "--no-privileges",
-                "--jobs=4",
-                str(backup_dir)
+                *format_args,
+                str(restore_source)
             ]
             
-            env = {"PGPASSWORD": target_config.password}
+            env = self._restore_env(target_config, jobs)
             
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -349,11 +501,76 @@ class RestoreManager:
                 stderr=asyncio.subprocess.PIPE
             )
             
-            await self._monitor_restore_process(process, restore_id, "Restoring directory format backup")
+            stderr = await self._monitor_restore_process(
+                process, restore_id, "Restoring directory format backup", jobs
+            )
             
             if process.returncode != 0:
-                stderr = await process.stderr.read()
-                raise RuntimeError(f"pg_restore failed: {stderr.decode()}")
+                raise RuntimeError(f"pg_restore failed: {stderr}")
+    
+    async def _list_toc_entries(self, restore_source: Path, format_args: Optional[List[str]] = None) -> int:
+        """Count the items pg_restore would restore from restore_source, or 0 if unknown"""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "pg_restore", "--list", *(format_args or []), str(restore_source),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await process.communicate()
+        except OSError:
+            return 0
+        
+        return _count_toc_entries(stdout) if process.returncode == 0 else 0
+    
+    def _extract_archive(self, backup_file: Path, dest_dir: Path) -> Optional[str]:
+        """Extract a backup archive into dest_dir and return its toc.dat directory"""
+        toc_dir = None
+        if backup_file.suffix != ".tar" or not hasattr(os, "sendfile"):
+            # Compressed archives are inflated in a single streaming pass,
+            # looking for toc.dat on the way
+            extract_args = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+            with tarfile.open(backup_file, 'r|*', copybufsize=TAR_COPY_BUFSIZE) as tar:
+                for member in tar:
+                    if toc_dir is None:
+                        toc_dir = _toc_dir_of(member)
+                    tar.extract(member, dest_dir, **extract_args)
+            return toc_dir
+        
+        # Uncompressed members are copied straight out of the archive file
+        # by the kernel with sendfile, bypassing user space
+        dest_root = dest_dir.resolve()
+        with open(backup_file, 'rb') as archive, tarfile.open(fileobj=archive, mode='r:') as tar:
+            for member in tar:
+                target = (dest_root / member.name).resolve()
+                if target != dest_root and dest_root not in target.parents:
+                    raise RuntimeError(f"Unsafe path in backup archive: {member.name}")
+                
+                if toc_dir is None:
+                    toc_dir = _toc_dir_of(member)
+                
+                if member.isdir():
+                    target.mkdir(parents=True, exist_ok=True)
+                elif member.isfile():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with open(target, 'wb') as out:
+                        offset = member.offset_data
+                        remaining = member.size
+                        while remaining > 0:
+                            sent = os.sendfile(out.fileno(), archive.fileno(), offset, remaining)
+                            if sent == 0:
+                                raise RuntimeError(f"Truncated backup archive: {member.name}")
+                            offset += sent
+                            remaining -= sent
+        return toc_dir
+    
+    def _find_toc_dir(self, backup_file: Path) -> Optional[str]:
+        """Return the archive directory holding toc.dat, or None if absent"""
+        with tarfile.open(backup_file, 'r|*') as tar:
+            for member in tar:
+                toc_dir = _toc_dir_of(member)
+                if toc_dir is not None:
+                    return toc_dir
+        return None
     
     async def _restore_sql_format(
         self, 
@@ -373,30 +590,78 @@ class RestoreManager:
             "--verbose"
         ]
         
-        env = {"PGPASSWORD": target_config.password}
+        env = self._restore_env(target_config)
         
         # Prepare input file
-        if backup_file.suffix == '.sql.gz':
-            # For compressed SQL, we need to decompress first
-            process = await asyncio.create_subprocess_exec(
-                "gunzip", "-c", str(backup_file),
-                stdout=asyncio.subprocess.PIPE
-            )
-            gunzip_stdout, _ = await process.communicate()
-            
-            if process.returncode != 0:
-                raise RuntimeError("Failed to decompress SQL file")
+        if backup_file.name.endswith('.sql.gz'):
+            decompressor = shutil.which("pigz") or shutil.which("gunzip")
             
-            # Pipe to psql
-            psql_process = await asyncio.create_subprocess_exec(
-                *cmd,
-                env=env,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            if decompressor:
+                # Connect the decompressor straight to psql through a kernel
+                # pipe so both run concurrently without buffering in Python
+                read_fd, write_fd = os.pipe()
+                try:
+                    gunzip_process = await asyncio.create_subprocess_exec(
+                        decompressor, "-dc", str(backup_file),
+                        stdout=write_fd
+                    )
+                    try:
+                        psql_process = await asyncio.create_subprocess_exec(
+                            *cmd,
+                            env=env,
+                            stdin=read_fd,
+                            stdout=asyncio.subprocess.PIPE,
+                            stderr=asyncio.subprocess.PIPE
+                        )
+                    except BaseException:
+                        # Don't leave the decompressor orphaned
+                        gunzip_process.kill()
+                        await gunzip_process.wait()
+                        raise
+                finally:
+                    os.close(read_fd)
+                    os.close(write_fd)
+                
+                stderr, _ = await asyncio.gather(
+                    self._monitor_restore_process(psql_process, restore_id, "Restoring SQL backup"),
+                    gunzip_process.wait()
+                )
+                
+                # When psql exits early (bad credentials, missing database)
+                # the decompressor dies of SIGPIPE; psql's error is the cause
+                if psql_process.returncode != 0:
+                    raise RuntimeError(f"psql failed: {stderr}")
+                if gunzip_process.returncode != 0:
+                    raise RuntimeError("Failed to decompress SQL file")
             
-            stdout, stderr = await psql_process.communicate(input=gunzip_stdout)
+            else:
+                # No gzip binary available, feed psql from Python in chunks
+                psql_process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    env=env,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                
+                async def feed():
+                    try:
+                        with _gzip_mod.open(backup_file, 'rb') as f:
+                            while True:
+                                chunk = await self._run_blocking(f.read, 1024 * 1024)
+                                if not chunk:
+                                    break
+                                psql_process.stdin.write(chunk)
+                                await psql_process.stdin.drain()
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass
+                    finally:
+                        psql_process.stdin.close()
+                
+                _, stderr = await asyncio.gather(
+                    feed(),
+                    self._monitor_restore_process(psql_process, restore_id, "Restoring SQL backup")
+                )
             
         else:
             # For regular SQL files
@@ -409,43 +674,66 @@ class RestoreManager:
                     stderr=asyncio.subprocess.PIPE
                 )
                 
-                stdout, stderr = await psql_process.communicate()
-        
-        await self._monitor_restore_process(psql_process, restore_id, "Restoring SQL backup")
+                # Drain output as it arrives, keeping only the stderr tail
+                stderr = await self._monitor_restore_process(psql_process, restore_id, "Restoring SQL backup")
         
         if psql_process.returncode != 0:
-            raise RuntimeError(f"psql failed: {stderr.decode()}")
+            raise RuntimeError(f"psql failed: {stderr}")
     
     async def _monitor_restore_process(
         self, 
         process: asyncio.subprocess.Process, 
         restore_id: str, 
-        message: str
-    ):
-        """Monitor restore process progress"""
+        message: str,
+        jobs: int = 1
+    ) -> str:
+        """Monitor restore process progress, returning the tail of its stderr"""
         
-        start_time = time.time()
+        total_items = self.progress_totals.get(restore_id, 0)
+        item_pattern = _PG_RESTORE_FINISHED_PATTERN if jobs > 1 else _PG_RESTORE_ITEM_PATTERN
+        items_done = 0
+        last_progress = -1
+        stderr_tail: Deque[bytes] = deque(maxlen=200)
         
-        while process.returncode is None:
-            await asyncio.sleep(1)
-            
-            elapsed = int(time.time() - start_time)
-            
-            # Update progress callback if available
+        def report(progress: int, text: str):
             if restore_id in self.progress_callbacks:
                 try:
-                    # Simple time-based progress estimation
-                    progress = min(95, (elapsed * 100) // 600)  # Assume 10 minutes max
-                    self.progress_callbacks[restore_id](progress, f"{message} ({elapsed}s)")
+                    self.progress_callbacks[restore_id](progress, text)
                 except Exception:
                     pass
         
-        # Final update
-        if restore_id in self.progress_callbacks:
-            try:
-                self.progress_callbacks[restore_id](100, f"{message} completed")
-            except Exception:
+        async def drain_stdout():
+            if process.stdout is None:
+                return
+            async for _ in process.stdout:
                 pass
+        
+        async def drain_stderr():
+            nonlocal items_done, last_progress
+            if process.stderr is None:
+                return
+            async for line in process.stderr:
+                stderr_tail.append(line)
+                
+                # pg_restore --verbose logs one line per TOC item it handles
+                if not item_pattern.match(line):
+                    continue
+                items_done += 1
+                
+                if total_items:
+                    progress = min(95, (items_done * 100) // total_items)
+                    if progress != last_progress:
+                        last_progress = progress
+                        report(progress, f"{message} ({items_done}/{total_items} items)")
+                else:
+                    report(0, f"{message} ({items_done} items)")
+        
+        await asyncio.gather(drain_stdout(), drain_stderr(), process.wait())
+        
+        # Final update
+        report(100, f"{message} completed")
+        
+        return b"".join(stderr_tail).decode(errors="replace")
     
     async def _verify_restoration(
         self, 
@@ -487,5 +775,6 @@ class RestoreManager:
             del self.active_restores[restore_id]
             if restore_id in self.progress_callbacks:
                 del self.progress_callbacks[restore_id]
+            self.progress_totals.pop(restore_id, None)
             return True
         return False
\ No newline at end of file
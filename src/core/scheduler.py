@@ -3,10 +3,14 @@ Backup scheduler for PostgreSQL Backup & Restore Tool
 """
 
 import asyncio
+import heapq
 import json
+import os
+from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Deque, Dict, List, Optional, Callable, Tuple
 from croniter import croniter
 
 from .models import BackupJob, BackupResult, BackupStatus
@@ -25,14 +29,58 @@ class BackupScheduler:
         self.backup_manager = backup_manager
         self.running = False
         self.scheduled_jobs: Dict[str, BackupJob] = {}
-        self.job_history: List[BackupResult] = []
-        self.scheduler_task: Optional[asyncio.Task] = None
         self.max_history = 1000
+        self.job_history: Deque[BackupResult] = deque(maxlen=self.max_history)
+        self.scheduler_task: Optional[asyncio.Task] = None
+        self.max_concurrent_jobs = max(1, int(
+            config_manager.get_config_value("scheduler.max_concurrent_jobs", 2)
+        ))
+        
+        # Created on first use so it binds to the running event loop
+        self._run_sem: Optional[asyncio.Semaphore] = None
+        
+        # Parsed cron iterator and next fire time per scheduled job
+        self._cron_cache: Dict[str, croniter] = {}
+        self._next_fire: Dict[str, datetime] = {}
+        
+        # Min-heap of (fire time, job id); entries that no longer match
+        # _next_fire are stale and skipped
+        self._fire_heap: List[Tuple[datetime, str]] = []
+        
+        # Next run time computed for jobs without a live fire time (e.g. a
+        # schedule that failed to parse), keyed by job id with its schedule
+        self._next_run_cache: Dict[str, Tuple[str, Optional[datetime]]] = {}
+        
+        # Bumped whenever the scheduled job list or a next run time changes
+        self._revision = 0
+        
+    def _schedule_job(self, job: BackupJob):
+        """Parse a job's cron expression once and seed its next fire time"""
+        self._unschedule_job(job.id)
+        try:
+            cron = croniter(job.schedule, datetime.now())
+            self._cron_cache[job.id] = cron
+            self._set_next_fire(job.id, cron.get_next(datetime))
+        except Exception as e:
+            logger.error(f"Error parsing cron schedule for job {job.name}: {e}")
+    
+    def _unschedule_job(self, job_id: str):
+        """Drop cached schedule state for a job"""
+        self._cron_cache.pop(job_id, None)
+        self._next_run_cache.pop(job_id, None)
         
+        # Drop the job's heap entries too: if it is scheduled again for the
+        # same fire time, a leftover entry would look current again
+        if self._next_fire.pop(job_id, None) is not None:
+            self._fire_heap = [entry for entry in self._fire_heap if entry[1] != job_id]
+            heapq.heapify(self._fire_heap)
+    
     def add_job(self, job: BackupJob):
         """Add a backup job to the schedule"""
         if job.schedule and job.enabled:
             self.scheduled_jobs[job.id] = job
+            self._schedule_job(job)
+            self._revision += 1
             logger.info(f"Added scheduled job: {job.name} ({job.schedule})")
         else:
             logger.warning(f"Job {job.name} not scheduled: no schedule or disabled")
@@ -41,23 +89,38 @@ class BackupScheduler:
         """Remove a backup job from the schedule"""
         if job_id in self.scheduled_jobs:
             del self.scheduled_jobs[job_id]
+            self._unschedule_job(job_id)
+            self._revision += 1
             logger.info(f"Removed scheduled job: {job_id}")
     
     def update_job(self, job: BackupJob):
         """Update a backup job in the schedule"""
         if job.schedule and job.enabled:
+            previous = self.scheduled_jobs.get(job.id)
             self.scheduled_jobs[job.id] = job
+            if previous is None or previous.schedule != job.schedule or job.id not in self._cron_cache:
+                self._schedule_job(job)
+            self._revision += 1
             logger.info(f"Updated scheduled job: {job.name}")
         else:
             self.remove_job(job.id)
     
+    @property
+    def revision(self) -> int:
+        """Changes whenever get_scheduled_jobs or a next run time would differ"""
+        return self._revision
+    
     def get_scheduled_jobs(self) -> List[BackupJob]:
         """Get all scheduled jobs"""
         return list(self.scheduled_jobs.values())
     
     def get_job_history(self, limit: int = 100) -> List[BackupResult]:
         """Get job execution history"""
-        return self.job_history[-limit:]
+        return self._recent_history(limit)
+    
+    def _recent_history(self, limit: int) -> List[BackupResult]:
+        """Return the newest ``limit`` history entries, oldest first"""
+        return list(islice(self.job_history, max(0, len(self.job_history) - limit), None))
     
     async def start(self):
         """Start the scheduler"""
@@ -112,6 +175,7 @@ class BackupScheduler:
                 # Check if job should run now
                 if self._should_run_job(job, now):
                     logger.info(f"Running scheduled job: {job.name}")
+                    self._advance_job(job.id, now)
                     
                     # Run job in background
                     asyncio.create_task(self._run_job(job))
@@ -124,20 +188,38 @@ class BackupScheduler:
         if not job.schedule:
             return False
         
-        try:
-            cron = croniter(job.schedule, now)
-            next_run = cron.get_next(datetime)
-            
-            # Check if the next run time is within the next minute
-            time_diff = next_run - now
-            return 0 <= time_diff.total_seconds() <= 60
-            
-        except Exception as e:
-            logger.error(f"Error parsing cron schedule for job {job.name}: {e}")
-            return False
+        next_fire = self._next_fire.get(job.id)
+        return next_fire is not None and now >= next_fire
+    
+    def _advance_job(self, job_id: str, now: datetime):
+        """Move a job's cached fire time past ``now``"""
+        cron = self._cron_cache[job_id]
+        next_fire = cron.get_next(datetime)
+        while next_fire <= now:
+            next_fire = cron.get_next(datetime)
+        self._set_next_fire(job_id, next_fire)
+    
+    def _set_next_fire(self, job_id: str, next_fire: datetime):
+        """Record a job's next fire time in the cache and the heap"""
+        self._next_fire[job_id] = next_fire
+        self._revision += 1
+        heapq.heappush(self._fire_heap, (next_fire, job_id))
+        
+        # Rebuild once stale entries dominate the heap
+        if len(self._fire_heap) > 2 * len(self._next_fire) + 16:
+            self._fire_heap = [(t, j) for j, t in self._next_fire.items()]
+            heapq.heapify(self._fire_heap)
     
     async def _run_job(self, job: BackupJob):
-        """Execute a backup job"""
+        """Execute a backup job, at most max_concurrent_jobs at a time"""
+        if self._run_sem is None:
+            self._run_sem = asyncio.Semaphore(self.max_concurrent_jobs)
+        
+        async with self._run_sem:
+            await self._execute_job(job)
+    
+    async def _execute_job(self, job: BackupJob):
+        """Run a backup job and record its result"""
         try:
             # Create progress callback
             def progress_callback(progress: int, message: str):
@@ -176,11 +258,8 @@ class BackupScheduler:
     
     def _add_to_history(self, result: BackupResult):
         """Add result to job history"""
+        # The deque drops the oldest entry once max_history is reached
         self.job_history.append(result)
-        
-        # Limit history size
-        if len(self.job_history) > self.max_history:
-            self.job_history = self.job_history[-self.max_history:]
     
     async def _handle_retention(self, job: BackupJob):
         """Handle backup retention for a job"""
@@ -191,22 +270,24 @@ class BackupScheduler:
                 return
             
             # Get all backup files for this job
-            cutoff_date = datetime.now() - timedelta(days=job.retention_days)
+            cutoff_ts = (datetime.now() - timedelta(days=job.retention_days)).timestamp()
             
-            for backup_file in backup_dir.glob(f"{job.name}_*"):
-                try:
-                    # Extract timestamp from filename
-                    timestamp_str = backup_file.stem.split('_')[-1]
-                    file_date = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+            prefix = f"{job.name}_"
+            
+            with os.scandir(backup_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(prefix):
+                        continue
                     
-                    # Delete old files
-                    if file_date < cutoff_date:
-                        backup_file.unlink()
-                        logger.info(f"Deleted old backup: {backup_file}")
-                        
-                except (ValueError, IndexError):
-                    # Skip files that don't match the expected pattern
-                    continue
+                    try:
+                        # Delete old files
+                        if entry.stat().st_mtime < cutoff_ts:
+                            os.unlink(entry.path)
+                            logger.info(f"Deleted old backup: {entry.path}")
+                            
+                    except FileNotFoundError:
+                        # Removed by someone else since the directory was listed
+                        continue
             
         except Exception as e:
             logger.error(f"Error handling retention for job {job.name}: {e}")
@@ -216,12 +297,22 @@ class BackupScheduler:
         if not job.schedule or not job.enabled:
             return None
         
+        if job.id in self._next_fire:
+            return self._next_fire[job.id]
+        
+        now = datetime.now()
+        cached = self._next_run_cache.get(job.id)
+        if cached is not None and cached[0] == job.schedule and (cached[1] is None or cached[1] > now):
+            return cached[1]
+        
         try:
-            cron = croniter(job.schedule, datetime.now())
-            return cron.get_next(datetime)
+            next_run = croniter(job.schedule, now).get_next(datetime)
         except Exception as e:
             logger.error(f"Error getting next run time for job {job.name}: {e}")
-            return None
+            next_run = None
+        
+        self._next_run_cache[job.id] = (job.schedule, next_run)
+        return next_run
     
     def get_job_stats(self) -> Dict[str, any]:
         """Get scheduler statistics"""
@@ -229,7 +320,7 @@ class BackupScheduler:
         enabled_jobs = sum(1 for job in self.scheduled_jobs.values() if job.enabled)
         
         # Recent history stats
-        recent_history = self.job_history[-100:]  # Last 100 runs
+        recent_history = self._recent_history(100)  # Last 100 runs
         successful_runs = sum(1 for result in recent_history if result.status == BackupStatus.COMPLETED)
         failed_runs = sum(1 for result in recent_history if result.status == BackupStatus.FAILED)
         
@@ -276,36 +367,43 @@ class BackupScheduler:
         """Enable a job"""
         if job_id in self.scheduled_jobs:
             self.scheduled_jobs[job_id].enabled = True
+            self._revision += 1
             logger.info(f"Enabled job: {job_id}")
     
     def disable_job(self, job_id: str):
         """Disable a job"""
         if job_id in self.scheduled_jobs:
             self.scheduled_jobs[job_id].enabled = False
+            self._revision += 1
             logger.info(f"Disabled job: {job_id}")
     
     def get_upcoming_runs(self, hours: int = 24) -> List[Dict[str, any]]:
         """Get upcoming job runs"""
-        upcoming = []
-        now = datetime.now()
-        end_time = now + timedelta(hours=hours)
+        end_time = datetime.now() + timedelta(hours=hours)
+        heap = self._fire_heap
         
-        for job in self.scheduled_jobs.values():
-            if not job.enabled or not job.schedule:
+        # Walk only the part of the heap that fires before end_time; a
+        # node's children are never earlier than the node itself
+        due = []
+        pending = [0] if heap else []
+        while pending:
+            index = pending.pop()
+            next_run, job_id = heap[index]
+            if next_run > end_time:
                 continue
             
-            try:
-                cron = croniter(job.schedule, now)
-                next_run = cron.get_next(datetime)
-                
-                if next_run <= end_time:
-                    upcoming.append({
-                        "job_id": job.id,
-                        "job_name": job.name,
-                        "next_run": next_run.isoformat(),
-                        "schedule": job.schedule
-                    })
-            except Exception:
-                continue
+            job = self.scheduled_jobs.get(job_id)
+            if self._next_fire.get(job_id) == next_run and job is not None and job.enabled:
+                due.append((next_run, job))
+            
+            pending.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(heap))
         
-        return sorted(upcoming, key=lambda x: x["next_run"])
\ No newline at end of file
+        return [
+            {
+                "job_id": job.id,
+                "job_name": job.name,
+                "next_run": next_run.isoformat(),
+                "schedule": job.schedule
+            }
+            for next_run, job in sorted(due, key=lambda item: item[0])
+        ]
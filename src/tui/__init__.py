@@ -2,10 +2,19 @@
 Terminal User Interface for PostgreSQL Backup & Restore Tool
 """
 
-from .app import PostgresBackupTUI
-
-from .screens import *
-
 __all__ = [
     'PostgresBackupTUI'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Defer importing Textual until the TUI is actually used
+    if name == 'PostgresBackupTUI':
+        from .app import PostgresBackupTUI
+        return PostgresBackupTUI
+
+    from . import screens
+    try:
+        return getattr(screens, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
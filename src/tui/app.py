@@ -3,8 +3,12 @@ Main TUI application for PostgreSQL Backup & Restore Tool
 """
 
 import asyncio
+import os
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Type
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
@@ -12,11 +16,13 @@ from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, Button, ListView, ListItem, Label
 from textual.reactive import reactive
 from textual.binding import Binding
+from rich.text import Text
 
 from ..core.config import ConfigManager
 from ..core.backup import BackupManager
 from ..core.restore import RestoreManager
 from ..core.scheduler import BackupScheduler
+from ..core.database import db_pool
 from ..utils.logger import setup_logging, get_logger
 
 from .screens import (
@@ -29,28 +35,26 @@ from .screens import (
 )
 
 
-class PostgresBackupTUI(App):
-    """Main TUI application with sidebar navigation"""
-    
-    CSS = """
+# Application stylesheet, dedented once at import time
+_CSS = textwrap.dedent("""
     App {
         background: $surface;
         layout: horizontal;
     }
-    
+
     Header {
         background: $primary;
         text-align: center;
         dock: top;
         height: 3;
     }
-    
+
     Footer {
         background: $surface;
         dock: bottom;
         height: 3;
     }
-    
+
     #sidebar {
         background: $panel;
         border-right: solid $primary;
@@ -58,11 +62,11 @@ class PostgresBackupTUI(App):
         width: 25%;
         dock: left;
     }
-    
+
     #main-content {
         padding: 1;
     }
-    
+
     .sidebar-title {
         text-align: center;
         text-style: bold;
@@ -71,7 +75,7 @@ class PostgresBackupTUI(App):
         padding: 1;
         background: $surface;
     }
-    
+
     .nav-button {
         width: 100%;
         margin: 1 0;
@@ -79,35 +83,35 @@ class PostgresBackupTUI(App):
         border: solid $primary;
         background: $surface;
     }
-    
+
     .nav-button:hover {
         background: $secondary;
     }
-    
+
     .nav-button.active {
         background: $primary;
         color: $text;
     }
-    
+
     .status-panel {
         background: $panel;
         border: solid $primary;
         padding: 1;
         margin: 1 0;
     }
-    
+
     .column-container {
         layout: horizontal;
         height: 100%;
     }
-    
+
     .column {
         padding: 1;
         background: $surface;
         border: solid $primary;
         width: 1fr;
     }
-    
+
     .panel-title {
         text-style: bold;
         color: $primary;
@@ -115,65 +119,98 @@ class PostgresBackupTUI(App):
         padding: 0 0 1 0;
         border-bottom: solid $accent;
     }
-    
+
     .info-text {
         color: $text;
         margin: 1 0;
     }
-    
+
     .success {
         color: $success;
     }
-    
+
     .error {
         color: $error;
     }
-    
+
     .warning {
         color: $warning;
     }
-    
+
     .button-group {
         layout: horizontal;
         height: auto;
         margin: 1 0;
     }
-    
+
     .button-group > Button {
         margin: 0 1;
     }
-    
+
     .form-container {
         padding: 1;
         background: $panel;
         margin: 1 0;
     }
-    
+
     .form-row {
         layout: horizontal;
         height: 3;
         margin: 1 0;
     }
-    
+
     .form-row > Label {
         width: 20%;
         text-align: right;
         padding: 0 1 0 0;
     }
-    
+
     .form-row > Input {
         width: 80%;
     }
-    """
+""")
+
+# Sidebar navigation entries: (icon label, key, screen name)
+_NAV_ITEMS = (
+    ("📊 Dashboard", "1", "dashboard"),
+    ("💾 Backup", "2", "backup"),
+    ("📥 Restore", "3", "restore"),
+    ("⏰ Schedule", "4", "schedule"),
+    ("⚙️ Config", "5", "config"),
+    ("📋 Logs", "6", "logs"),
+)
+
+# Button label, screen name, button name and tooltip for each entry,
+# formatted once
+_NAV_SPEC = tuple(
+    (f"{label} [{key}]", screen_name, f"nav-{screen_name}", f"Press {key} or click to open {label}")
+    for label, key, screen_name in _NAV_ITEMS
+)
+
+def _make_nav_button(label: str, button_name: str, tooltip: str) -> Button:
+    """Create one sidebar navigation button"""
+    button = Button(label, name=button_name, classes="nav-button")
+    button.tooltip = tooltip
+    return button
+
+
+# Minimum seconds between manual refreshes and status panel updates
+REFRESH_INTERVAL = 0.25
+
+
+class PostgresBackupTUI(App):
+    """Main TUI application with sidebar navigation"""
+    
+    CSS = _CSS
     
     BINDINGS = [
         Binding("q", "quit", "Quit"),
-        Binding("1", "dashboard", "Dashboard"),
-        Binding("2", "backup", "Backup"),
-        Binding("3", "restore", "Restore"),
-        Binding("4", "schedule", "Schedule"),
-        Binding("5", "config", "Config"),
-        Binding("6", "logs", "Logs"),
+        Binding("1", "nav('dashboard')", "Dashboard"),
+        Binding("2", "nav('backup')", "Backup"),
+        Binding("3", "nav('restore')", "Restore"),
+        Binding("4", "nav('schedule')", "Schedule"),
+        Binding("5", "nav('config')", "Config"),
+        Binding("6", "nav('logs')", "Logs"),
         Binding("ctrl+r", "refresh", "Refresh"),
         Binding("tab", "focus_next", "Next"),
         Binding("shift+tab", "focus_previous", "Previous"),
@@ -192,24 +229,55 @@ class PostgresBackupTUI(App):
         self.restore_manager = RestoreManager(self.config_manager)
         self.scheduler = BackupScheduler(self.config_manager, self.backup_manager)
         
-        # Setup logging
-        log_file = self.config_manager.get_app_dir() / "tui.log"
-        setup_logging(
-            log_level=self.config_manager.get_config_value("app.log_level", "INFO"),
-            log_file=log_file
+        self.logger = get_logger(__name__)
+        
+        # Bounded pool for blocking work handed off by the managers
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=min(8, (os.cpu_count() or 2) * 2),
+            thread_name_prefix="pgbackup-io"
         )
         
-        self.logger = get_logger(__name__)
+        # Navigation buttons by screen name, filled in during compose
+        self._nav_buttons: Dict[str, Button] = {}
+        
+        # Sidebar status panel, created during compose
+        self._status_panel_widget: Optional[Static] = None
         
-        # Initialize screens
-        self.screens = {
-            "dashboard": DashboardScreen(self),
-            "backup": BackupScreen(self),
-            "restore": RestoreScreen(self),
-            "schedule": ScheduleScreen(self),
-            "config": ConfigScreen(self),
-            "logs": LogsScreen(self)
+        # Refreshes and status panel updates are coalesced to ~4 per second
+        self._refresh_deadline = 0.0
+        self._status_timer = None
+        
+        # Screens are built and installed on first visit
+        self._screen_factories: Dict[str, Type[Screen]] = {
+            "dashboard": DashboardScreen,
+            "backup": BackupScreen,
+            "restore": RestoreScreen,
+            "schedule": ScheduleScreen,
+            "config": ConfigScreen,
+            "logs": LogsScreen
         }
+        self._screens: Dict[str, Screen] = {}
+    
+    def _load_screen(self, name: str) -> Screen:
+        """Return the screen registered under name, creating it if needed"""
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screens[name] = self._screen_factories[name](self)
+            self.install_screen(screen, name=name)
+        return screen
+    
+    def invalidate_screen(self, name: str) -> bool:
+        """Drop a cached screen so its next visit rebuilds it from scratch"""
+        screen = self._screens.get(name)
+        if screen is None:
+            return True
+        if screen in self.screen_stack:
+            # The visible screen cannot be uninstalled
+            return False
+        
+        del self._screens[name]
+        self.uninstall_screen(screen)
+        return True
     
     def compose(self) -> ComposeResult:
         """Compose the app with sidebar layout"""
@@ -220,58 +288,63 @@ class PostgresBackupTUI(App):
             yield self._create_sidebar_navigation()
             yield self._create_status_panel()
         
-        with Container(id="main-content"):
-            yield Container(id="screen-container")
+        yield Container(id="main-content")
         
         yield Footer()
     
     def _create_sidebar_navigation(self):
         """Create sidebar navigation buttons"""
-        nav_items = [
-            ("📊 Dashboard", "1", "dashboard"),
-            ("💾 Backup", "2", "backup"),
-            ("📥 Restore", "3", "restore"),
-            ("⏰ Schedule", "4", "schedule"),
-            ("⚙️ Config", "5", "config"),
-            ("📋 Logs", "6", "logs")
-        ]
-        
-        buttons = []
-        for label, key, screen_name in nav_items:
-            button = Button(
-                f"{label} [{key}]",
-                name=f"nav-{screen_name}",
-                classes="nav-button"
-            )
-            button.tooltip = f"Press {key} or click to open {label.replace(' [', '').split(' [')[0]}"
-            buttons.append(button)
-        
-        return Container(*buttons)
+        self._nav_buttons = {
+            screen_name: _make_nav_button(label, button_name, tooltip)
+            for label, screen_name, button_name, tooltip in _NAV_SPEC
+        }
+        return Container(*self._nav_buttons.values())
     
     def _create_status_panel(self):
         """Create status panel in sidebar"""
-        return Container(
-            Static("📈 Status", classes="panel-title"),
-            Static("🟢 System Ready", classes="info-text"),
-            Static("Source: Configured", classes="info-text"),
-            Static("Target: Configured", classes="info-text"),
-            Static("Jobs: 0 Active", classes="info-text"),
-            classes="status-panel"
+        self._status_panel_widget = Static(self._render_status(), classes="status-panel")
+        return self._status_panel_widget
+    
+    def _render_status(self) -> Text:
+        """Build the status panel contents as a single renderable"""
+        return Text.assemble(
+            ("📈 Status", "bold"),
+            "\n\n🟢 System Ready",
+            "\nSource: Configured",
+            "\nTarget: Configured",
+            f"\nJobs: {len(self.scheduler.get_scheduled_jobs())} Active"
         )
     
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Called when app is mounted"""
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(self._io_executor)
+        
+        # Setup logging off the event loop so opening the log file does not
+        # hold up the first paint
+        log_file = self.config_manager.get_app_dir() / "tui.log"
+        await loop.run_in_executor(
+            None,
+            setup_logging,
+            self.config_manager.get_config_value("app.log_level", "INFO"),
+            log_file
+        )
+        
         self.logger.info("TUI application started")
         
         # Show dashboard by default
-        self.push_screen(self.screens["dashboard"])
+        self.push_screen(self._load_screen("dashboard"))
         self.current_screen_name = "dashboard"
         
         # Highlight first navigation button
         self._update_navigation_highlight("dashboard")
         
-        # Start scheduler in background
-        asyncio.create_task(self._start_scheduler())
+        # Start scheduler in background. On Python 3.12+ the task runs
+        # eagerly up to its first real suspension point
+        if hasattr(asyncio, "eager_task_factory"):
+            self._scheduler_start_task = asyncio.eager_task_factory(loop, self._start_scheduler())
+        else:
+            self._scheduler_start_task = loop.create_task(self._start_scheduler())
     
     async def _start_scheduler(self):
         """Start the backup scheduler"""
@@ -291,32 +364,17 @@ class PostgresBackupTUI(App):
             screen_name = button_name[4:]  # Remove "nav-" prefix
             self._navigate_to_screen(screen_name)
     
-    def action_dashboard(self) -> None:
-        """Navigate to dashboard"""
-        self._navigate_to_screen("dashboard")
-    
-    def action_backup(self) -> None:
-        """Navigate to backup screen"""
-        self._navigate_to_screen("backup")
-    
-    def action_restore(self) -> None:
-        """Navigate to restore screen"""
-        self._navigate_to_screen("restore")
-    
-    def action_schedule(self) -> None:
-        """Navigate to schedule screen"""
-        self._navigate_to_screen("schedule")
-    
-    def action_config(self) -> None:
-        """Navigate to config screen"""
-        self._navigate_to_screen("config")
-    
-    def action_logs(self) -> None:
-        """Navigate to logs screen"""
-        self._navigate_to_screen("logs")
+    def action_nav(self, screen_name: str) -> None:
+        """Navigate to the named screen"""
+        self._navigate_to_screen(screen_name)
     
     def action_refresh(self) -> None:
         """Refresh current screen"""
+        now = time.monotonic()
+        if now < self._refresh_deadline:
+            return
+        self._refresh_deadline = now + REFRESH_INTERVAL
+        
         current_screen = self.screen
         if hasattr(current_screen, 'refresh'):
             current_screen.refresh()
@@ -324,13 +382,12 @@ class PostgresBackupTUI(App):
     
     def _navigate_to_screen(self, screen_name: str) -> None:
         """Navigate to a specific screen"""
-        if screen_name in self.screens:
-            # Clear current screen container
-            screen_container = self.query_one("#screen-container")
-            screen_container.remove_children()
-            
-            # Push new screen
-            self.push_screen(self.screens[screen_name])
+        if screen_name == self.current_screen_name:
+            return
+        
+        if screen_name in self._screen_factories:
+            # Swap the installed screen in place of the current one
+            self.switch_screen(self._load_screen(screen_name))
             self.current_screen_name = screen_name
             
             # Update navigation highlighting
@@ -338,21 +395,22 @@ class PostgresBackupTUI(App):
     
     def _update_navigation_highlight(self, active_screen: str) -> None:
         """Update navigation menu highlighting"""
-        for button in self.query("Button.nav-button"):
-            button_name = button.name
-            if button_name and button_name == f"nav-{active_screen}":
-                button.add_class("active")
-            else:
-                button.remove_class("active")
+        with self.batch_update():
+            for screen_name, button in self._nav_buttons.items():
+                button.set_class(screen_name == active_screen, "active")
     
     def _update_status_panel(self):
+        """Schedule a status panel update, merging calls that arrive together"""
+        if self._status_timer is None:
+            self._status_timer = self.set_timer(REFRESH_INTERVAL, self._do_update_status_panel)
+    
+    def _do_update_status_panel(self):
         """Update the status panel with current information"""
-        try:
-            status_panel = self.query_one(".status-panel")
-            # Update status information here
-            # This would fetch real-time data from the backup manager
-        except:
-            pass
+        self._status_timer = None
+        status_panel = self._status_panel_widget
+        if status_panel is None:
+            return
+        status_panel.update(self._render_status())
     
     def show_status_message(self, message: str, message_type: str = "info") -> None:
         """Show status message to user"""
@@ -379,12 +437,20 @@ class PostgresBackupTUI(App):
         await self.scheduler.stop()
         
         # Close database connections
-        from ..core.database import db_pool
         await db_pool.close_all()
+        
+        self._io_executor.shutdown(wait=False)
 
 
 def run_tui(config_file: Optional[Path] = None):
     """Run the TUI application"""
+    # Use the libuv-based event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     app = PostgresBackupTUI(config_file)
     app.run()
 
@@ -3,28 +3,221 @@ TUI screens for PostgreSQL Backup & Restore Tool with column-based layout
 """
 
 from textual.screen import Screen
-from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
-from textual.widgets import (
-    Static, Button, ListView, ListItem, Label, 
-    ProgressBar, DataTable, Input, Select
-)
+from textual.containers import Container, Horizontal, Vertical
+from textual.widgets import Static, Button, ListView, ListItem, Label, Input, Select
 from textual.binding import Binding
-from datetime import datetime
-from typing import Optional
+from rich.text import Text
+import time
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Imported where used so they load with the first screen that needs them
+    from textual.widgets import ProgressBar, RichLog
+
+# Bindings shared by several screens
+_CANCEL_BINDING = Binding("c", "cancel", "Cancel")
+_REFRESH_BINDING = Binding("r", "refresh", "Refresh")
+
+# Form row specs: (label, placeholder, input name, default value, password)
+FormRowSpec = Tuple[str, str, str, str, bool]
+
+
+def _db_spec(prefix: str) -> Tuple[FormRowSpec, ...]:
+    """Connection form rows for the source or target database"""
+    return (
+        ("Host:", "localhost", f"{prefix}_host", "localhost", False),
+        ("Port:", "5432", f"{prefix}_port", "5432", False),
+        ("Database:", f"{prefix}_db", f"{prefix}_database", "", False),
+        ("Username:", "postgres", f"{prefix}_username", "postgres", False),
+        ("Password:", "password", f"{prefix}_password", "", True),
+    )
+
+
+DB_SPECS = {prefix: _db_spec(prefix) for prefix in ("source", "target")}
+
+BACKUP_SETTINGS_SPEC: Tuple[FormRowSpec, ...] = (
+    ("Backup Directory:", "/path/to/backups", "backup_dir", "", False),
+    ("Retention Days:", "30", "retention_days", "30", False),
+    ("Description:", "Optional backup description", "description", "", False),
+)
+
+JOB_SPEC: Tuple[FormRowSpec, ...] = (
+    ("Job Name:", "daily_backup", "job_name", "", False),
+    ("Cron Expression:", "0 2 * * *", "cron_expr", "", False),
+    ("Source Database:", "source_db", "source_db", "", False),
+)
+
+JOB_DESCRIPTION_SPEC: Tuple[FormRowSpec, ...] = (
+    ("Description:", "Daily backup at 2 AM", "description", "", False),
+)
+
+DEFAULT_LOG_MAX_ENTRIES = 100
+
+LOG_FILTER_SPEC: Tuple[FormRowSpec, ...] = (
+    ("Max Entries:", "100", "max_entries", str(DEFAULT_LOG_MAX_ENTRIES), False),
+    ("Filter:", "keyword", "filter_keyword", "", False),
+)
+
+# Select options shared by every screen build
+_YES_NO = (("Yes", "yes"), ("No", "no"))
+_BACKUP_TYPE_OPTIONS = (("Full", "full"), ("Incremental", "incremental"), ("Differential", "differential"))
+_COMPRESSION_OPTIONS = (("GZIP", "gzip"), ("BZIP2", "bzip2"), ("None", "none"))
+_SSL_OPTIONS = tuple(
+    (mode, mode) for mode in ("disable", "allow", "prefer", "require", "verify-ca", "verify-full")
+)
+_LOG_LEVEL_OPTIONS = (("DEBUG", "debug"), ("INFO", "info"), ("WARNING", "warning"), ("ERROR", "error"))
+_LOG_LEVEL_STYLES = {"warning": "yellow", "error": "red"}
+
+# Log statistics panel rows: (counter key, label, CSS classes)
+_LOG_STAT_FIELDS = (
+    ("total", "Total Entries", "info-text"),
+    ("error", "Errors", "info-text error"),
+    ("warning", "Warnings", "info-text warning"),
+    ("info", "Info", "info-text"),
+)
+STATS_FLUSH_INTERVAL = 0.25
+
+# Minimum seconds between repeated refresh / test actions (key autorepeat)
+ACTION_THROTTLE = 0.25
+
+# Recent entries shown when the logs screen opens: (level, line)
+SAMPLE_LOG_LINES = (
+    ("info", "[2023-10-15 12:00:00] INFO: Application started"),
+    ("info", "[2023-10-15 12:00:01] INFO: Scheduler started"),
+    ("info", "[2023-10-15 12:00:02] INFO: Source database connected"),
+    ("info", "[2023-10-15 12:00:03] INFO: Target database connected"),
+    ("warning", "[2023-10-15 12:00:04] WARNING: Connection timeout warning"),
+    ("error", "[2023-10-15 12:00:05] ERROR: Failed to connect to backup server"),
+    ("info", "[2023-10-15 12:00:06] INFO: Retrying connection..."),
+    ("info", "[2023-10-15 12:00:07] INFO: Connection established"),
+    ("info", "[2023-10-15 12:00:08] INFO: Backup job started"),
+    ("info", "[2023-10-15 12:00:09] INFO: Backup completed successfully"),
+)
+
+# Dashboard status and statistics panel lines
+STATUS_LINES = (
+    "Active Jobs: 0",
+    "Source DB: Connected",
+    "Target DB: Connected",
+)
+BACKUP_STATS_LINES = (
+    "Total Backups: 42",
+    "Total Size: 8.5 GB",
+    "This Month: 12",
+    "Success Rate: 98.5%",
+)
+
+# Sample entries for the dashboard activity, restore backup and schedule job lists
+ACTIVITY_TEXTS = (
+    "✅ Backup completed: source_db_20231015_120000",
+    "✅ Restore completed: target_db",
+    "📅 Schedule created: daily_backup",
+    "⚙️ Configuration updated",
+    "🔍 Connection tested: source_db",
+)
+
+BACKUP_LIST_TEXTS = (
+    "📦 source_db_20231015_120000.dump.gz - 250MB",
+    "📦 source_db_20231014_120000.dump.gz - 245MB",
+    "📦 source_db_20231013_120000.dump.gz - 240MB",
+    "📦 source_db_20231012_120000.dump.gz - 238MB",
+)
+
+JOB_LIST_TEXTS = (
+    "📅 daily_backup - 0 2 * * * (✅ Enabled)",
+    "📅 weekly_backup - 0 3 * * 0 (✅ Enabled)",
+    "📅 monthly_backup - 0 4 1 * * (❌ Disabled)",
+    "📅 hourly_backup - 0 * * * * (✅ Enabled)",
+)
+
+
+def _form_rows(spec: Tuple[FormRowSpec, ...]) -> Iterator[Container]:
+    """Yield a labelled Input row for each entry in a form spec"""
+    for label, placeholder, name, value, password in spec:
+        yield Container(
+            Label(label),
+            Input(placeholder=placeholder, name=name, value=value, password=password),
+            classes="form-row"
+        )
+
+
+class DbConnectionForm(Container):
+    """Connection rows for the source or target database, followed by any extra children"""
+    
+    def __init__(self, *children, prefix: str, ssl: bool = False, intro: str = ""):
+        super().__init__(classes="form-container")
+        self.prefix = prefix
+        self.ssl = ssl
+        self.intro = intro
+        self._trailing = children
+    
+    def compose(self):
+        if self.intro:
+            yield Static(self.intro, classes="info-text")
+        yield from _form_rows(DB_SPECS[self.prefix])
+        if self.ssl:
+            yield Container(
+                Label("SSL Mode:"),
+                Select(_SSL_OPTIONS, name=f"{self.prefix}_ssl_mode", value="prefer"),
+                classes="form-row"
+            )
+            yield Container(
+                Label("Connection Timeout:"),
+                Input(placeholder="30", name=f"{self.prefix}_timeout", value="30"),
+                classes="form-row"
+            )
+        yield from self._trailing
+
+
+def _list_items(texts: Tuple[str, ...]) -> Iterator[ListItem]:
+    """Yield a labelled ListItem for each text"""
+    for text in texts:
+        yield ListItem(Label(text))
+
+
+def _info_lines(texts: Tuple[str, ...]) -> Iterator[Static]:
+    """Yield an info-text Static for each line"""
+    for text in texts:
+        yield Static(text, classes="info-text")
+
+
+class _Throttle:
+    """Let an action through at most once per interval, dropping repeats"""
+    
+    __slots__ = ("interval", "_deadline")
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._deadline = 0.0
+    
+    def ready(self) -> bool:
+        now = time.monotonic()
+        if now < self._deadline:
+            return False
+        self._deadline = now + self.interval
+        return True
+
+
+def _last_backup_text(timestamp: float) -> str:
+    """Dashboard label for the last backup time"""
+    return f"Last Backup: {time.strftime('%Y-%m-%d %H:%M', time.localtime(timestamp))}"
 
 
 class DashboardScreen(Screen):
     """Dashboard screen showing overview with column layout"""
     
-    BINDINGS = [
-        Binding("r", "refresh", "Refresh"),
+    BINDINGS = (
+        _REFRESH_BINDING,
         Binding("b", "backup", "New Backup"),
         Binding("s", "restore", "Restore"),
-    ]
+    )
     
     def __init__(self, app):
         super().__init__()
         self.main_app = app
+        self._last_backup_ts = self._latest_backup_ts() or time.time()
+        self._last_backup_label: Optional[Static] = None
+        self._refresh_throttle = _Throttle(ACTION_THROTTLE)
     
     def compose(self):
         with Container(classes="column-container"):
@@ -42,12 +235,11 @@ class DashboardScreen(Screen):
     
     def _create_status_panel(self):
         """Create system status panel"""
+        self._last_backup_label = Static(_last_backup_text(self._last_backup_ts), classes="info-text")
         return Container(
             Static("🟢 All Systems Operational", classes="info-text success"),
-            Static(f"Last Backup: {datetime.now().strftime('%Y-%m-%d %H:%M')}", classes="info-text"),
-            Static("Active Jobs: 0", classes="info-text"),
-            Static("Source DB: Connected", classes="info-text"),
-            Static("Target DB: Connected", classes="info-text"),
+            self._last_backup_label,
+            *_info_lines(STATUS_LINES),
             classes="form-container"
         )
     
@@ -67,13 +259,7 @@ class DashboardScreen(Screen):
     def _create_activity_panel(self):
         """Create recent activity panel"""
         return Container(
-            ListView(
-                ListItem(Label("✅ Backup completed: source_db_20231015_120000")),
-                ListItem(Label("✅ Restore completed: target_db")),
-                ListItem(Label("📅 Schedule created: daily_backup")),
-                ListItem(Label("⚙️ Configuration updated")),
-                ListItem(Label("🔍 Connection tested: source_db")),
-            ),
+            ListView(*_list_items(ACTIVITY_TEXTS)),
             classes="form-container"
         )
     
@@ -81,10 +267,7 @@ class DashboardScreen(Screen):
         """Create backup statistics panel"""
         return Container(
             Static("📈 Backup Statistics", classes="panel-title"),
-            Static("Total Backups: 42", classes="info-text"),
-            Static("Total Size: 8.5 GB", classes="info-text"),
-            Static("This Month: 12", classes="info-text"),
-            Static("Success Rate: 98.5%", classes="info-text"),
+            *_info_lines(BACKUP_STATS_LINES),
             classes="form-container"
         )
     
@@ -99,8 +282,20 @@ class DashboardScreen(Screen):
     
     def action_refresh(self):
         """Refresh dashboard data"""
+        if not self._refresh_throttle.ready():
+            return
+        
+        last_backup_ts = self._latest_backup_ts()
+        if last_backup_ts is not None and last_backup_ts != self._last_backup_ts:
+            self._last_backup_ts = last_backup_ts
+            self._last_backup_label.update(_last_backup_text(last_backup_ts))
         self.main_app.show_success("Dashboard refreshed")
     
+    def _latest_backup_ts(self) -> Optional[float]:
+        """Start time of the newest scheduler run, if any"""
+        history = self.main_app.scheduler.job_history
+        return history[-1].start_time.timestamp() if history else None
+    
     def action_backup(self):
         """Navigate to backup screen"""
         self.main_app._navigate_to_screen("backup")
@@ -113,15 +308,22 @@ class DashboardScreen(Screen):
 class BackupScreen(Screen):
     """Backup screen with column layout"""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("s", "start_backup", "Start Backup"),
         Binding("t", "test_source", "Test Source"),
-        Binding("c", "cancel", "Cancel"),
-    ]
+        _CANCEL_BINDING,
+    )
     
     def __init__(self, app):
         super().__init__()
         self.main_app = app
+        self._progress_bar: Optional[ProgressBar] = None
+        self._progress_status: Optional[Static] = None
+    
+    def on_mount(self):
+        """Look up the progress widgets once"""
+        self._progress_bar = self.query_one("#backup_progress")
+        self._progress_status = self.query_one("#progress_status", Static)
     
     def compose(self):
         with Container(classes="column-container"):
@@ -139,34 +341,9 @@ class BackupScreen(Screen):
     
     def _create_source_config(self):
         """Create source database configuration"""
-        return Container(
-            Container(
-                Label("Host:"),
-                Input(placeholder="localhost", name="source_host", value="localhost"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Port:"),
-                Input(placeholder="5432", name="source_port", value="5432"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Database:"),
-                Input(placeholder="source_db", name="source_database"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Username:"),
-                Input(placeholder="postgres", name="source_username", value="postgres"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Password:"),
-                Input(placeholder="password", password=True, name="source_password"),
-                classes="form-row"
-            ),
+        return DbConnectionForm(
             Button("🔍 Test Source Connection", name="test_source", variant="primary"),
-            classes="form-container"
+            prefix="source"
         )
     
     def _create_backup_options(self):
@@ -176,7 +353,7 @@ class BackupScreen(Screen):
             Container(
                 Label("Backup Type:"),
                 Select(
-                    [("Full", "full"), ("Incremental", "incremental"), ("Differential", "differential")],
+                    _BACKUP_TYPE_OPTIONS,
                     name="backup_type",
                     value="full"
                 ),
@@ -185,7 +362,7 @@ class BackupScreen(Screen):
             Container(
                 Label("Compression:"),
                 Select(
-                    [("GZIP", "gzip"), ("BZIP2", "bzip2"), ("None", "none")],
+                    _COMPRESSION_OPTIONS,
                     name="compression",
                     value="gzip"
                 ),
@@ -202,30 +379,18 @@ class BackupScreen(Screen):
     def _create_backup_settings(self):
         """Create backup settings"""
         return Container(
-            Container(
-                Label("Backup Directory:"),
-                Input(placeholder="/path/to/backups", name="backup_dir"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Retention Days:"),
-                Input(placeholder="30", name="retention_days", value="30"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Description:"),
-                Input(placeholder="Optional backup description", name="description"),
-                classes="form-row"
-            ),
+            *_form_rows(BACKUP_SETTINGS_SPEC),
             classes="form-container"
         )
     
     def _create_progress_section(self):
         """Create progress section"""
+        from textual.widgets import ProgressBar
+        
         return Container(
             Static("📊 Progress", classes="panel-title"),
-            ProgressBar(total=100, show_eta=True, name="backup_progress"),
-            Static("Ready to start backup...", name="progress_status", classes="info-text"),
+            ProgressBar(total=100, show_eta=True, name="backup_progress", id="backup_progress"),
+            Static("Ready to start backup...", name="progress_status", id="progress_status", classes="info-text"),
             Container(
                 Button("🚀 Start Backup", name="start_backup", variant="primary"),
                 Button("❌ Cancel", name="cancel"),
@@ -245,13 +410,10 @@ class BackupScreen(Screen):
     
     def _start_backup(self):
         """Start backup process"""
-        progress_bar = self.query_one("#backup_progress", ProgressBar)
-        progress_bar.advance(10)
-        
-        status = self.query_one("#progress_status", Static)
-        status.update("🔄 Starting backup...")
-        
-        self.main_app.show_success("Backup started successfully")
+        with self.main_app.batch_update():
+            self._progress_bar.advance(10)
+            self._progress_status.update("🔄 Starting backup...")
+            self.main_app.show_success("Backup started successfully")
     
     def _test_source_connection(self):
         """Test source database connection"""
@@ -273,15 +435,22 @@ class BackupScreen(Screen):
 class RestoreScreen(Screen):
     """Restore screen with column layout"""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("s", "start_restore", "Start Restore"),
         Binding("t", "test_target", "Test Target"),
-        Binding("c", "cancel", "Cancel"),
-    ]
+        _CANCEL_BINDING,
+    )
     
     def __init__(self, app):
         super().__init__()
         self.main_app = app
+        self._progress_bar: Optional[ProgressBar] = None
+        self._progress_status: Optional[Static] = None
+    
+    def on_mount(self):
+        """Look up the progress widgets once"""
+        self._progress_bar = self.query_one("#restore_progress")
+        self._progress_status = self.query_one("#restore_status", Static)
     
     def compose(self):
         with Container(classes="column-container"):
@@ -299,34 +468,9 @@ class RestoreScreen(Screen):
     
     def _create_target_config(self):
         """Create target database configuration"""
-        return Container(
-            Container(
-                Label("Host:"),
-                Input(placeholder="localhost", name="target_host", value="localhost"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Port:"),
-                Input(placeholder="5432", name="target_port", value="5432"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Database:"),
-                Input(placeholder="target_db", name="target_database"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Username:"),
-                Input(placeholder="postgres", name="target_username", value="postgres"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Password:"),
-                Input(placeholder="password", password=True, name="target_password"),
-                classes="form-row"
-            ),
+        return DbConnectionForm(
             Button("🔍 Test Target Connection", name="test_target", variant="primary"),
-            classes="form-container"
+            prefix="target"
         )
     
     def _create_restore_options(self):
@@ -335,17 +479,17 @@ class RestoreScreen(Screen):
             Static("⚙️ Restore Options", classes="panel-title"),
             Container(
                 Label("Drop Existing:"),
-                Select([("Yes", "yes"), ("No", "no")], name="drop_existing", value="no"),
+                Select(_YES_NO, name="drop_existing", value="no"),
                 classes="form-row"
             ),
             Container(
                 Label("Verify After:"),
-                Select([("Yes", "yes"), ("No", "no")], name="verify_after", value="yes"),
+                Select(_YES_NO, name="verify_after", value="yes"),
                 classes="form-row"
             ),
             Container(
                 Label("Clean Before:"),
-                Select([("Yes", "yes"), ("No", "no")], name="clean_before", value="yes"),
+                Select(_YES_NO, name="clean_before", value="yes"),
                 classes="form-row"
             ),
             classes="form-container"
@@ -354,21 +498,18 @@ class RestoreScreen(Screen):
     def _create_backup_list(self):
         """Create list of available backups"""
         return Container(
-            ListView(
-                ListItem(Label("📦 source_db_20231015_120000.dump.gz - 250MB")),
-                ListItem(Label("📦 source_db_20231014_120000.dump.gz - 245MB")),
-                ListItem(Label("📦 source_db_20231013_120000.dump.gz - 240MB")),
-                ListItem(Label("📦 source_db_20231012_120000.dump.gz - 238MB")),
-            ),
+            ListView(*_list_items(BACKUP_LIST_TEXTS)),
             classes="form-container"
         )
     
     def _create_restore_progress(self):
         """Create restore progress section"""
+        from textual.widgets import ProgressBar
+        
         return Container(
             Static("📊 Restore Progress", classes="panel-title"),
-            ProgressBar(total=100, show_eta=True, name="restore_progress"),
-            Static("Select a backup to restore...", name="restore_status", classes="info-text"),
+            ProgressBar(total=100, show_eta=True, name="restore_progress", id="restore_progress"),
+            Static("Select a backup to restore...", name="restore_status", id="restore_status", classes="info-text"),
             Container(
                 Button("🚀 Start Restore", name="start_restore", variant="primary"),
                 Button("❌ Cancel", name="cancel"),
@@ -388,13 +529,10 @@ class RestoreScreen(Screen):
     
     def _start_restore(self):
         """Start restore process"""
-        progress_bar = self.query_one("#restore_progress", ProgressBar)
-        progress_bar.advance(10)
-        
-        status = self.query_one("#restore_status", Static)
-        status.update("🔄 Starting restore...")
-        
-        self.main_app.show_success("Restore started successfully")
+        with self.main_app.batch_update():
+            self._progress_bar.advance(10)
+            self._progress_status.update("🔄 Starting restore...")
+            self.main_app.show_success("Restore started successfully")
     
     def _test_target_connection(self):
         """Test target database connection"""
@@ -416,15 +554,21 @@ class RestoreScreen(Screen):
 class ScheduleScreen(Screen):
     """Schedule screen with column layout"""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("a", "add_job", "Add Job"),
         Binding("d", "delete_job", "Delete Job"),
-        Binding("r", "refresh", "Refresh"),
-    ]
+        _REFRESH_BINDING,
+    )
     
     def __init__(self, app):
         super().__init__()
         self.main_app = app
+        self._inputs: List[Input] = []
+        self._refresh_throttle = _Throttle(ACTION_THROTTLE)
+    
+    def on_mount(self):
+        """Collect the form inputs once"""
+        self._inputs = list(self.query(Input))
     
     def compose(self):
         with Container(classes="column-container"):
@@ -442,31 +586,13 @@ class ScheduleScreen(Screen):
     def _create_job_form(self):
         """Create job creation form"""
         return Container(
-            Container(
-                Label("Job Name:"),
-                Input(placeholder="daily_backup", name="job_name"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Cron Expression:"),
-                Input(placeholder="0 2 * * *", name="cron_expr"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Source Database:"),
-                Input(placeholder="source_db", name="source_db"),
-                classes="form-row"
-            ),
+            *_form_rows(JOB_SPEC),
             Container(
                 Label("Enabled:"),
-                Select([("Yes", "yes"), ("No", "no")], name="enabled", value="yes"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Description:"),
-                Input(placeholder="Daily backup at 2 AM", name="description"),
+                Select(_YES_NO, name="enabled", value="yes"),
                 classes="form-row"
             ),
+            *_form_rows(JOB_DESCRIPTION_SPEC),
             Container(
                 Button("➕ Add Job", name="add_job", variant="primary"),
                 Button("🧹 Clear Form", name="clear_form"),
@@ -478,12 +604,7 @@ class ScheduleScreen(Screen):
     def _create_jobs_list(self):
         """Create list of scheduled jobs"""
         return Container(
-            ListView(
-                ListItem(Label("📅 daily_backup - 0 2 * * * (✅ Enabled)")),
-                ListItem(Label("📅 weekly_backup - 0 3 * * 0 (✅ Enabled)")),
-                ListItem(Label("📅 monthly_backup - 0 4 1 * * (❌ Disabled)")),
-                ListItem(Label("📅 hourly_backup - 0 * * * * (✅ Enabled)")),
-            ),
+            ListView(*_list_items(JOB_LIST_TEXTS)),
             classes="form-container"
         )
     
@@ -511,7 +632,8 @@ class ScheduleScreen(Screen):
         elif event.button.name == "stop_all":
             self.main_app.show_warning("All jobs stopped")
         elif event.button.name == "refresh_jobs":
-            self.main_app.show_success("Job list refreshed")
+            if self._refresh_throttle.ready():
+                self.main_app.show_success("Job list refreshed")
     
     def _add_job(self):
         """Add new scheduled job"""
@@ -519,9 +641,10 @@ class ScheduleScreen(Screen):
     
     def _clear_form(self):
         """Clear the form"""
-        # Clear all input fields
-        for input_widget in self.query("Input"):
-            input_widget.value = ""
+        # Clear all input fields in one repaint
+        with self.main_app.batch_update():
+            for input_widget in self._inputs:
+                input_widget.value = ""
     
     def action_add_job(self):
         """Add job action"""
@@ -533,22 +656,33 @@ class ScheduleScreen(Screen):
     
     def action_refresh(self):
         """Refresh action"""
-        self.main_app.show_success("Schedule refreshed")
+        if self._refresh_throttle.ready():
+            self.main_app.show_success("Schedule refreshed")
 
 
 class ConfigScreen(Screen):
     """Configuration screen with column layout for database reconfiguration"""
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("s", "save_config", "Save Config"),
         Binding("t", "test_connections", "Test All"),
         Binding("r", "reset_config", "Reset"),
         Binding("l", "load_config", "Load"),
-    ]
+    )
     
     def __init__(self, app):
         super().__init__()
         self.main_app = app
+        self._source_test_result: Optional[Static] = None
+        self._target_test_result: Optional[Static] = None
+        self._input_defaults: List[Tuple[Input, str]] = []
+        self._test_throttle = _Throttle(ACTION_THROTTLE)
+    
+    def on_mount(self):
+        """Look up the connection test result widgets and input defaults once"""
+        self._source_test_result = self.query_one("#source_test_result", Static)
+        self._target_test_result = self.query_one("#target_test_result", Static)
+        self._input_defaults = [(input_widget, input_widget.value) for input_widget in self.query(Input)]
     
     def compose(self):
         with Container(classes="column-container"):
@@ -566,49 +700,10 @@ class ConfigScreen(Screen):
     
     def _create_source_db_config(self):
         """Create source database configuration"""
-        return Container(
-            Static("Configure your source database connection", classes="info-text"),
-            Container(
-                Label("Host:"),
-                Input(placeholder="localhost", name="source_host", value="localhost"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Port:"),
-                Input(placeholder="5432", name="source_port", value="5432"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Database:"),
-                Input(placeholder="source_database", name="source_database"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Username:"),
-                Input(placeholder="postgres", name="source_username", value="postgres"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Password:"),
-                Input(placeholder="password", password=True, name="source_password"),
-                classes="form-row"
-            ),
-            Container(
-                Label("SSL Mode:"),
-                Select(
-                    [("disable", "disable"), ("allow", "allow"), ("prefer", "prefer"), 
-                     ("require", "require"), ("verify-ca", "verify-ca"), ("verify-full", "verify-full")],
-                    name="source_ssl_mode",
-                    value="prefer"
-                ),
-                classes="form-row"
-            ),
-            Container(
-                Label("Connection Timeout:"),
-                Input(placeholder="30", name="source_timeout", value="30"),
-                classes="form-row"
-            ),
-            classes="form-container"
+        return DbConnectionForm(
+            prefix="source",
+            ssl=True,
+            intro="Configure your source database connection"
         )
     
     def _create_source_test_section(self):
@@ -617,55 +712,16 @@ class ConfigScreen(Screen):
             Static("🔍 Source Connection Test", classes="panel-title"),
             Static("Test your source database connection before saving", classes="info-text"),
             Button("🔗 Test Source Connection", name="test_source", variant="primary"),
-            Static("", name="source_test_result", classes="info-text"),
+            Static("", name="source_test_result", id="source_test_result", classes="info-text"),
             classes="form-container"
         )
     
     def _create_target_db_config(self):
         """Create target database configuration"""
-        return Container(
-            Static("Configure your target database connection", classes="info-text"),
-            Container(
-                Label("Host:"),
-                Input(placeholder="localhost", name="target_host", value="localhost"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Port:"),
-                Input(placeholder="5432", name="target_port", value="5432"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Database:"),
-                Input(placeholder="target_database", name="target_database"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Username:"),
-                Input(placeholder="postgres", name="target_username", value="postgres"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Password:"),
-                Input(placeholder="password", password=True, name="target_password"),
-                classes="form-row"
-            ),
-            Container(
-                Label("SSL Mode:"),
-                Select(
-                    [("disable", "disable"), ("allow", "allow"), ("prefer", "prefer"), 
-                     ("require", "require"), ("verify-ca", "verify-ca"), ("verify-full", "verify-full")],
-                    name="target_ssl_mode",
-                    value="prefer"
-                ),
-                classes="form-row"
-            ),
-            Container(
-                Label("Connection Timeout:"),
-                Input(placeholder="30", name="target_timeout", value="30"),
-                classes="form-row"
-            ),
-            classes="form-container"
+        return DbConnectionForm(
+            prefix="target",
+            ssl=True,
+            intro="Configure your target database connection"
         )
     
     def _create_target_test_section(self):
@@ -674,7 +730,7 @@ class ConfigScreen(Screen):
             Static("🔍 Target Connection Test", classes="panel-title"),
             Static("Test your target database connection before saving", classes="info-text"),
             Button("🔗 Test Target Connection", name="test_target", variant="primary"),
-            Static("", name="target_test_result", classes="info-text"),
+            Static("", name="target_test_result", id="target_test_result", classes="info-text"),
             classes="form-container"
         )
     
@@ -687,34 +743,47 @@ class ConfigScreen(Screen):
     
     def _test_source_connection(self):
         """Test source database connection"""
-        result = self.query_one("#source_test_result", Static)
-        result.update("🔄 Testing source connection...")
+        self._source_test_result.update("🔄 Testing source connection...")
         
         # Simulate connection test
-        self.set_timer(1.0, lambda: result.update("✅ Source connection successful"))
+        self.set_timer(1.0, self._finish_source_test)
         self.main_app.show_success("Source database connection successful")
     
+    def _finish_source_test(self):
+        """Show the simulated source test result"""
+        self._source_test_result.update("✅ Source connection successful")
+    
     def _test_target_connection(self):
         """Test target database connection"""
-        result = self.query_one("#target_test_result", Static)
-        result.update("🔄 Testing target connection...")
+        self._target_test_result.update("🔄 Testing target connection...")
         
         # Simulate connection test
-        self.set_timer(1.0, lambda: result.update("✅ Target connection successful"))
+        self.set_timer(1.0, self._finish_target_test)
         self.main_app.show_success("Target database connection successful")
     
+    def _finish_target_test(self):
+        """Show the simulated target test result"""
+        self._target_test_result.update("✅ Target connection successful")
+    
     def action_save_config(self):
         """Save configuration action"""
         self.main_app.show_success("Configuration saved successfully")
     
     def action_test_connections(self):
         """Test all connections action"""
-        self._test_source_connection()
-        self._test_target_connection()
+        if not self._test_throttle.ready():
+            return
+        
+        with self.main_app.batch_update():
+            self._test_source_connection()
+            self._test_target_connection()
     
     def action_reset_config(self):
         """Reset configuration action"""
-        self.main_app.show_warning("Configuration reset to defaults")
+        with self.main_app.batch_update():
+            for input_widget, default in self._input_defaults:
+                input_widget.value = default
+            self.main_app.show_warning("Configuration reset to defaults")
     
     def action_load_config(self):
         """Load configuration action"""
@@ -724,16 +793,31 @@ class ConfigScreen(Screen):
 class LogsScreen(Screen):
     """Logs screen with column layout"""
     
-    BINDINGS = [
-        Binding("r", "refresh", "Refresh"),
+    BINDINGS = (
+        _REFRESH_BINDING,
         Binding("c", "clear", "Clear"),
         Binding("e", "export", "Export"),
         Binding("f", "filter", "Filter"),
-    ]
+    )
     
     def __init__(self, app):
         super().__init__()
         self.main_app = app
+        self._log_view: Optional[RichLog] = None
+        self._stats: Dict[str, int] = {key: 0 for key, _, _ in _LOG_STAT_FIELDS}
+        self._stats_dirty = False
+        self._stat_widgets: Dict[str, Static] = {}
+        self._refresh_throttle = _Throttle(ACTION_THROTTLE)
+    
+    def on_mount(self):
+        """Look up the log display and fill it with the recent entries"""
+        self._log_view = self.query_one("#log_display")
+        self._stat_widgets = {
+            key: self.query_one(f"#log_stat_{key}", Static) for key, _, _ in _LOG_STAT_FIELDS
+        }
+        self._write_log_lines(SAMPLE_LOG_LINES)
+        self._flush_stats()
+        self.set_interval(STATS_FLUSH_INTERVAL, self._flush_stats)
     
     def compose(self):
         with Container(classes="column-container"):
@@ -754,22 +838,13 @@ class LogsScreen(Screen):
             Container(
                 Label("Log Level:"),
                 Select(
-                    [("DEBUG", "debug"), ("INFO", "info"), ("WARNING", "warning"), ("ERROR", "error")],
+                    _LOG_LEVEL_OPTIONS,
                     name="log_level",
                     value="info"
                 ),
                 classes="form-row"
             ),
-            Container(
-                Label("Max Entries:"),
-                Input(placeholder="100", name="max_entries", value="100"),
-                classes="form-row"
-            ),
-            Container(
-                Label("Filter:"),
-                Input(placeholder="keyword", name="filter_keyword"),
-                classes="form-row"
-            ),
+            *_form_rows(LOG_FILTER_SPEC),
             Container(
                 Button("🔄 Refresh", name="refresh_logs", variant="primary"),
                 Button("🧹 Clear", name="clear_logs"),
@@ -783,35 +858,59 @@ class LogsScreen(Screen):
         """Create log statistics panel"""
         return Container(
             Static("📊 Log Statistics", classes="panel-title"),
-            Static("Total Entries: 1,234", classes="info-text"),
-            Static("Errors: 5", classes="info-text error"),
-            Static("Warnings: 23", classes="info-text warning"),
-            Static("Info: 1,206", classes="info-text"),
+            *(
+                Static(f"{label}: 0", id=f"log_stat_{key}", classes=classes)
+                for key, label, classes in _LOG_STAT_FIELDS
+            ),
             classes="form-container"
         )
     
     def _create_log_display(self):
         """Create log display area"""
+        from textual.widgets import RichLog
+        
         return Container(
-            ScrollableContainer(
-                Static("[2023-10-15 12:00:00] INFO: Application started", classes="info-text"),
-                Static("[2023-10-15 12:00:01] INFO: Scheduler started", classes="info-text"),
-                Static("[2023-10-15 12:00:02] INFO: Source database connected", classes="info-text"),
-                Static("[2023-10-15 12:00:03] INFO: Target database connected", classes="info-text"),
-                Static("[2023-10-15 12:00:04] WARNING: Connection timeout warning", classes="info-text warning"),
-                Static("[2023-10-15 12:00:05] ERROR: Failed to connect to backup server", classes="info-text error"),
-                Static("[2023-10-15 12:00:06] INFO: Retrying connection...", classes="info-text"),
-                Static("[2023-10-15 12:00:07] INFO: Connection established", classes="info-text"),
-                Static("[2023-10-15 12:00:08] INFO: Backup job started", classes="info-text"),
-                Static("[2023-10-15 12:00:09] INFO: Backup completed successfully", classes="info-text"),
-            ),
+            RichLog(max_lines=DEFAULT_LOG_MAX_ENTRIES, id="log_display"),
             classes="form-container"
         )
     
+    def _write_log_lines(self, lines):
+        """Append (level, text) log lines to the display"""
+        for level, line in lines:
+            self._log_view.write(Text(line, style=_LOG_LEVEL_STYLES.get(level, "")))
+            self.append_log(level)
+    
+    def append_log(self, level: str):
+        """Count a new log entry; the statistics panel catches up on the next flush"""
+        self._stats["total"] += 1
+        if level in self._stats:
+            self._stats[level] += 1
+        self._stats_dirty = True
+    
+    def _flush_stats(self):
+        """Repaint the statistics panel if any counts changed"""
+        if not self._stats_dirty:
+            return
+        self._stats_dirty = False
+        with self.main_app.batch_update():
+            for key, label, _ in _LOG_STAT_FIELDS:
+                self._stat_widgets[key].update(f"{label}: {self._stats[key]:,}")
+    
+    def on_input_changed(self, event: Input.Changed):
+        """Apply a new Max Entries value to the display buffer"""
+        if event.input.name != "max_entries":
+            return
+        try:
+            max_entries = int(event.value)
+        except ValueError:
+            return
+        if max_entries > 0:
+            self._log_view.max_lines = max_entries
+    
     def on_button_pressed(self, event):
         """Handle button presses"""
         if event.button.name == "refresh_logs":
-            self.main_app.show_success("Logs refreshed")
+            self.action_refresh()
         elif event.button.name == "clear_logs":
             self.main_app.show_warning("Logs cleared")
         elif event.button.name == "export_logs":
@@ -819,7 +918,8 @@ class LogsScreen(Screen):
     
     def action_refresh(self):
         """Refresh logs action"""
-        self.main_app.show_success("Logs refreshed")
+        if self._refresh_throttle.ready():
+            self.main_app.show_success("Logs refreshed")
     
     def action_clear(self):
         """Clear logs action"""
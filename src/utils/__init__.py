@@ -3,7 +3,10 @@ Utilities for PostgreSQL Backup & Restore Tool
 """
 
 from .logger import get_logger, setup_logging
-from .crypto import encrypt_file, decrypt_file, generate_checksum
+from .crypto import (
+    encrypt_file, decrypt_file, generate_checksum,
+    encrypt_file_async, decrypt_file_async, generate_checksum_async
+)
 from .progress import ProgressTracker, ProgressCallback
 from .validation import validate_backup_file, validate_database_config
 
@@ -13,6 +16,9 @@ __all__ = [
     'encrypt_file',
     'decrypt_file',
     'generate_checksum',
+    'encrypt_file_async',
+    'decrypt_file_async',
+    'generate_checksum_async',
     'ProgressTracker',
     'ProgressCallback',
     'validate_backup_file',
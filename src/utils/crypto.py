@@ -2,49 +2,124 @@
 Cryptographic utilities for PostgreSQL Backup & Restore Tool
 """
 
+import asyncio
 import hashlib
 import os
+import struct
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hashes, hmac
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+# Streaming file format:
+#   magic | PBKDF2 iterations (uint32 BE) | salt | iv | AES-256-CTR ciphertext | HMAC-SHA256
+ENCRYPTION_MAGIC = b"PGBKENC1"
+ITERATIONS_FORMAT = struct.Struct(">I")
+SALT_SIZE = 16
+IV_SIZE = 16
+MAC_SIZE = 32
+ENCRYPT_BUFSIZE = 1024 * 1024
 
-def generate_key(password: str, salt: Optional[bytes] = None) -> tuple[bytes, bytes]:
-    """Generate encryption key from password"""
-    if salt is None:
-        salt = os.urandom(16)
+# PBKDF2-SHA256 work factor for new files; the Fernet format always used 100k
+KDF_ITERATIONS = 600000
+LEGACY_KDF_ITERATIONS = 100000
+MAX_KDF_ITERATIONS = 10000000
+KDF_CACHE_SIZE = 32
+
+# Derived keys keyed by (sha256(password), salt, iterations, length), so a
+# repeat decrypt in the same process skips PBKDF2
+_kdf_cache: "OrderedDict[Tuple[bytes, bytes, int, int], bytes]" = OrderedDict()
+_kdf_cache_lock = threading.Lock()
+
+
+def _drop_cache(f) -> None:
+    """Evict a file that was just read once from the page cache"""
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _pbkdf2(password: str, salt: bytes, iterations: int, length: int) -> bytes:
+    """PBKDF2-HMAC-SHA256, reusing keys already derived in this process"""
+    secret = password.encode()
+    cache_key = (hashlib.sha256(secret).digest(), salt, iterations, length)
+    with _kdf_cache_lock:
+        derived = _kdf_cache.get(cache_key)
+        if derived is not None:
+            _kdf_cache.move_to_end(cache_key)
+            return derived
     
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
-        length=32,
+        length=length,
         salt=salt,
-        iterations=100000,
+        iterations=iterations,
     )
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+    derived = kdf.derive(secret)
+    
+    with _kdf_cache_lock:
+        _kdf_cache[cache_key] = derived
+        if len(_kdf_cache) > KDF_CACHE_SIZE:
+            _kdf_cache.popitem(last=False)
+    
+    return derived
+
+
+def generate_key(password: str, salt: Optional[bytes] = None) -> tuple[bytes, bytes]:
+    """Generate encryption key from password"""
+    if salt is None:
+        salt = os.urandom(16)
+    
+    key = base64.urlsafe_b64encode(_pbkdf2(password, salt, LEGACY_KDF_ITERATIONS, 32))
     return key, salt
 
 
+def derive_stream_keys(
+    password: str,
+    salt: bytes,
+    iterations: int = KDF_ITERATIONS
+) -> tuple[bytes, bytes]:
+    """Derive the AES and HMAC keys for streaming file encryption"""
+    key_material = _pbkdf2(password, salt, iterations, 64)
+    return key_material[:32], key_material[32:]
+
+
 def encrypt_file(file_path: Path, password: str, output_path: Optional[Path] = None) -> Path:
     """Encrypt a file with password"""
     if output_path is None:
         output_path = file_path.with_suffix(file_path.suffix + '.enc')
     
-    key, salt = generate_key(password)
-    fernet = Fernet(key)
-    
-    # Read and encrypt file
-    with open(file_path, 'rb') as f:
-        data = f.read()
+    salt = os.urandom(SALT_SIZE)
+    iv = os.urandom(IV_SIZE)
+    enc_key, mac_key = derive_stream_keys(password, salt)
+    encryptor = Cipher(algorithms.AES(enc_key), modes.CTR(iv)).encryptor()
+    mac = hmac.HMAC(mac_key, hashes.SHA256())
     
-    encrypted_data = fernet.encrypt(data)
-    
-    # Write salt + encrypted data
-    with open(output_path, 'wb') as f:
-        f.write(salt + encrypted_data)
+    # Write the header, then the ciphertext a chunk at a time, then an
+    # HMAC over everything before it
+    header = ENCRYPTION_MAGIC + ITERATIONS_FORMAT.pack(KDF_ITERATIONS) + salt + iv
+    buf = memoryview(bytearray(ENCRYPT_BUFSIZE))
+    with open(file_path, 'rb') as src, open(output_path, 'wb') as dst:
+        dst.write(header)
+        mac.update(header)
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            ciphertext = encryptor.update(buf[:n])
+            mac.update(ciphertext)
+            dst.write(ciphertext)
+        _drop_cache(src)
+        
+        tail = encryptor.finalize()
+        mac.update(tail)
+        dst.write(tail)
+        dst.write(mac.finalize())
     
     return output_path
 
@@ -58,10 +133,59 @@ def decrypt_file(encrypted_path: Path, password: str, output_path: Optional[Path
         else:
             output_path = encrypted_path.with_suffix('.dec')
     
-    # Read salt + encrypted data
     with open(encrypted_path, 'rb') as f:
-        salt = f.read(16)  # First 16 bytes are salt
-        encrypted_data = f.read()
+        if f.read(len(ENCRYPTION_MAGIC)) != ENCRYPTION_MAGIC:
+            f.seek(0)
+            return _decrypt_fernet_file(f, password, output_path)
+        
+        iterations_field = f.read(ITERATIONS_FORMAT.size)
+        salt = f.read(SALT_SIZE)
+        iv = f.read(IV_SIZE)
+        header_size = f.tell()
+        body_size = os.fstat(f.fileno()).st_size - header_size - MAC_SIZE
+        if len(iv) != IV_SIZE or body_size < 0:
+            raise ValueError(f"Encrypted file is truncated: {encrypted_path}")
+        
+        (iterations,) = ITERATIONS_FORMAT.unpack(iterations_field)
+        if not 1 <= iterations <= MAX_KDF_ITERATIONS:
+            raise ValueError(f"Encrypted file has an invalid key derivation header: {encrypted_path}")
+        enc_key, mac_key = derive_stream_keys(password, salt, iterations)
+        buf = memoryview(bytearray(ENCRYPT_BUFSIZE))
+        
+        # Verify the HMAC over the whole file before writing any plaintext
+        mac = hmac.HMAC(mac_key, hashes.SHA256())
+        mac.update(ENCRYPTION_MAGIC + iterations_field + salt + iv)
+        for chunk in _read_span(f, buf, body_size):
+            mac.update(chunk)
+        mac.verify(f.read(MAC_SIZE))
+        
+        f.seek(header_size)
+        decryptor = Cipher(algorithms.AES(enc_key), modes.CTR(iv)).decryptor()
+        with open(output_path, 'wb') as dst:
+            for chunk in _read_span(f, buf, body_size):
+                dst.write(decryptor.update(chunk))
+            dst.write(decryptor.finalize())
+        _drop_cache(f)
+    
+    return output_path
+
+
+def _read_span(f, buf: memoryview, size: int):
+    """Yield views of the next ``size`` bytes of f, read into buf"""
+    while size > 0:
+        n = f.readinto(buf[:min(size, len(buf))])
+        if not n:
+            raise ValueError("Encrypted file is truncated")
+        size -= n
+        yield buf[:n]
+
+
+def _decrypt_fernet_file(f, password: str, output_path: Path) -> Path:
+    """Decrypt a file written by the earlier salt + Fernet token format"""
+    # Read salt + encrypted data
+    salt = f.read(16)  # First 16 bytes are salt
+    encrypted_data = f.read()
+    _drop_cache(f)
     
     # Generate key from password and salt
     key, _ = generate_key(password, salt)
@@ -71,23 +195,89 @@ def decrypt_file(encrypted_path: Path, password: str, output_path: Optional[Path
     decrypted_data = fernet.decrypt(encrypted_data)
     
     # Write decrypted data
-    with open(output_path, 'wb') as f:
-        f.write(decrypted_data)
+    with open(output_path, 'wb') as out:
+        out.write(decrypted_data)
     
     return output_path
 
 
+CHECKSUM_BUFSIZE = 1024 * 1024
+CHECKSUM_CACHE_SIZE = 1024
+
+# Digests keyed by (st_dev, st_ino, st_size, st_mtime_ns, algorithm); rewriting
+# a file changes its size or mtime, so stale entries simply stop matching
+_checksum_cache: "OrderedDict[Tuple[int, int, int, int, str], str]" = OrderedDict()
+_checksum_cache_lock = threading.Lock()
+
+
 def generate_checksum(file_path: Path, algorithm: str = 'sha256') -> str:
-    """Generate file checksum"""
-    hash_func = getattr(hashlib, algorithm)()
+    """Generate file checksum, reusing the digest of an unchanged file"""
+    # Unbuffered: the hash loops read 256 KiB-1 MiB at a time into their own
+    # buffers, so a BufferedReader would only add a copy
+    with open(file_path, 'rb', buffering=0) as f:
+        st = os.fstat(f.fileno())
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, algorithm)
+        with _checksum_cache_lock:
+            digest = _checksum_cache.get(key)
+            if digest is not None:
+                _checksum_cache.move_to_end(key)
+                return digest
+        
+        digest = _hash_file(f, algorithm)
+    
+    with _checksum_cache_lock:
+        _checksum_cache[key] = digest
+        if len(_checksum_cache) > CHECKSUM_CACHE_SIZE:
+            _checksum_cache.popitem(last=False)
+    
+    return digest
+
+
+def _hash_file(f, algorithm: str) -> str:
+    """Hash an open file from its current position to the end"""
+    # Let the kernel read ahead aggressively so disk I/O overlaps hashing
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    if hasattr(hashlib, 'file_digest'):
+        digest = hashlib.file_digest(f, algorithm).hexdigest()
+        _drop_cache(f)
+        return digest
     
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_func.update(chunk)
+    # Python < 3.11: hash 1 MiB at a time from one reused buffer
+    hash_func = getattr(hashlib, algorithm)()
+    buf = memoryview(bytearray(CHECKSUM_BUFSIZE))
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        hash_func.update(buf[:n])
+    _drop_cache(f)
     
     return hash_func.hexdigest()
 
 
+async def _run_in_executor(func, *args):
+    """Run a blocking file operation on the loop's default executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
+async def encrypt_file_async(file_path: Path, password: str, output_path: Optional[Path] = None) -> Path:
+    """Encrypt a file with password without blocking the event loop"""
+    return await _run_in_executor(encrypt_file, file_path, password, output_path)
+
+
+async def decrypt_file_async(encrypted_path: Path, password: str, output_path: Optional[Path] = None) -> Path:
+    """Decrypt a file with password without blocking the event loop"""
+    return await _run_in_executor(decrypt_file, encrypted_path, password, output_path)
+
+
+async def generate_checksum_async(file_path: Path, algorithm: str = 'sha256') -> str:
+    """Generate file checksum without blocking the event loop"""
+    return await _run_in_executor(generate_checksum, file_path, algorithm)
+
+
 def verify_checksum(file_path: Path, expected_checksum: str, algorithm: str = 'sha256') -> bool:
     """Verify file checksum"""
     actual_checksum = generate_checksum(file_path, algorithm)
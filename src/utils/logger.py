@@ -5,9 +5,9 @@ Logging utilities for PostgreSQL Backup & Restore Tool
 import logging
 import logging.handlers
 import sys
+import time
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
 
 
 def setup_logging(
@@ -77,16 +77,19 @@ class OperationLogger:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = datetime.now()
-        self.logger.log(self.level, f"Starting {self.operation}")
+        self.start_time = time.perf_counter()
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, f"Starting {self.operation}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = datetime.now() - (self.start_time or datetime.now())
         if exc_type is None:
-            self.logger.log(self.level, f"Completed {self.operation} in {duration.total_seconds():.2f}s")
+            if self.logger.isEnabledFor(self.level):
+                duration = time.perf_counter() - (self.start_time or time.perf_counter())
+                self.logger.log(self.level, f"Completed {self.operation} in {duration:.2f}s")
         else:
-            self.logger.error(f"Failed {self.operation} after {duration.total_seconds():.2f}s: {exc_val}")
+            duration = time.perf_counter() - (self.start_time or time.perf_counter())
+            self.logger.error(f"Failed {self.operation} after {duration:.2f}s: {exc_val}")
         return False
 
 
@@ -3,9 +3,13 @@ Progress tracking utilities for PostgreSQL Backup & Restore Tool
 """
 
 import time
+from functools import partial
 from typing import Callable, Optional, Any
 from pathlib import Path
 
+# Minimum interval between throttled progress callbacks
+UPDATE_INTERVAL_NS = 100_000_000  # 100ms
+
 
 class ProgressCallback:
     """Progress callback function type"""
@@ -25,13 +29,13 @@ class ProgressTracker:
         self.total = total
         self.current = 0
         self.description = description
-        self.start_time = time.time()
-        self.last_update = 0
-        self.callback: Optional[ProgressCallback] = None
+        self.start_time = time.monotonic()
+        self._next_update_ns = 0
+        self.callback: Optional[Callable[[int, str], None]] = None
     
     def set_callback(self, callback: Callable[[int, str], None]):
         """Set progress callback function"""
-        self.callback = ProgressCallback(callback)
+        self.callback = callback
     
     def update(self, current: Optional[int] = None, message: Optional[str] = None):
         """Update progress"""
@@ -44,15 +48,15 @@ class ProgressTracker:
             self.description = message
         
         # Throttle updates to avoid too frequent calls
-        current_time = time.time()
-        if current_time - self.last_update < 0.1:  # 100ms throttle
+        now_ns = time.monotonic_ns()
+        if now_ns < self._next_update_ns:
             return
         
-        self.last_update = current_time
+        self._next_update_ns = now_ns + UPDATE_INTERVAL_NS
         
         if self.callback:
             progress = min(100, (self.current * 100) // self.total) if self.total > 0 else 0
-            elapsed = int(current_time - self.start_time)
+            elapsed = int(now_ns / 1e9 - self.start_time)
             status_message = f"{self.description} ({elapsed}s)"
             self.callback(progress, status_message)
     
@@ -64,7 +68,7 @@ class ProgressTracker:
         """Mark progress as finished"""
         self.current = self.total
         if self.callback:
-            elapsed = int(time.time() - self.start_time)
+            elapsed = int(time.monotonic() - self.start_time)
             status_message = f"{message} ({elapsed}s)"
             self.callback(100, status_message)
 
@@ -90,7 +94,7 @@ class FileProgressTracker(ProgressTracker):
             self.description = message
         
         if self.callback:
-            elapsed = int(time.time() - self.start_time)
+            elapsed = int(time.monotonic() - self.start_time)
             mb_processed = processed_bytes / (1024 * 1024)
             mb_total = self.file_size / (1024 * 1024)
             speed = mb_processed / elapsed if elapsed > 0 else 0
@@ -123,7 +127,7 @@ class DatabaseProgressTracker(ProgressTracker):
             self.description = message
         
         if self.callback:
-            elapsed = int(time.time() - self.start_time)
+            elapsed = int(time.monotonic() - self.start_time)
             status_message = (
                 f"{self.description}: {tables_processed}/{total_tables} tables "
                 f"({elapsed}s)"
@@ -138,40 +142,53 @@ class MultiProgressTracker:
         self.description = description
         self.trackers: list[ProgressTracker] = []
         self.weights: list[float] = []
-        self.start_time = time.time()
-        self.callback: Optional[ProgressCallback] = None
+        self.start_time = time.monotonic()
+        self.callback: Optional[Callable[[int, str], None]] = None
+        
+        # Last reported progress per tracker and the running sum of
+        # progress * weight, so a child update only applies its delta
+        self._progress: list[int] = []
+        self._weighted_sum = 0.0
+        self._total_weight = 0.0
     
     def add_tracker(self, tracker: ProgressTracker, weight: float = 1.0):
         """Add a progress tracker with weight"""
+        progress = _tracker_progress(tracker)
         self.trackers.append(tracker)
         self.weights.append(weight)
+        self._progress.append(progress)
+        self._weighted_sum += progress * weight
+        self._total_weight += weight
         
         # Set callback to update overall progress
-        def update_callback(progress: int, message: str):
-            self.update_overall()
-        
-        tracker.set_callback(update_callback)
+        tracker.set_callback(partial(self._on_tracker_update, len(self.trackers) - 1))
     
     def set_callback(self, callback: Callable[[int, str], None]):
         """Set overall progress callback"""
-        self.callback = ProgressCallback(callback)
+        self.callback = callback
+    
+    def _on_tracker_update(self, index: int, progress: int, message: str):
+        """Fold one tracker's new progress into the running weighted sum"""
+        self._weighted_sum += (progress - self._progress[index]) * self.weights[index]
+        self._progress[index] = progress
+        self._report()
     
     def update_overall(self):
         """Update overall progress based on all trackers"""
         if not self.trackers:
             return
         
-        total_weight = sum(self.weights)
-        weighted_progress = 0
-        
-        for tracker, weight in zip(self.trackers, self.weights):
-            progress = (tracker.current * 100) // tracker.total if tracker.total > 0 else 0
-            weighted_progress += (progress * weight) / total_weight
-        
-        if self.callback:
-            elapsed = int(time.time() - self.start_time)
+        self._progress = [_tracker_progress(tracker) for tracker in self.trackers]
+        self._weighted_sum = sum(p * w for p, w in zip(self._progress, self.weights))
+        self._total_weight = sum(self.weights)
+        self._report()
+    
+    def _report(self):
+        """Send the overall weighted progress to the callback"""
+        if self.callback and self._total_weight:
+            elapsed = int(time.monotonic() - self.start_time)
             status_message = f"{self.description} ({elapsed}s)"
-            self.callback(int(weighted_progress), status_message)
+            self.callback(int(self._weighted_sum / self._total_weight), status_message)
     
     def finish(self, message: str = "All operations completed"):
         """Mark all operations as finished"""
@@ -179,11 +196,16 @@ class MultiProgressTracker:
             tracker.finish()
         
         if self.callback:
-            elapsed = int(time.time() - self.start_time)
+            elapsed = int(time.monotonic() - self.start_time)
             status_message = f"{message} ({elapsed}s)"
             self.callback(100, status_message)
 
 
+def _tracker_progress(tracker: ProgressTracker) -> int:
+    """Percent complete of a tracker, as its callback would report it"""
+    return min(100, (tracker.current * 100) // tracker.total) if tracker.total > 0 else 0
+
+
 def create_console_progress_tracker() -> ProgressTracker:
     """Create a console progress tracker"""
     def console_callback(progress: int, message: str):
@@ -2,44 +2,87 @@
 FastAPI web application for PostgreSQL Backup & Restore Tool
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, UploadFile, File
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Body, Request, UploadFile, File
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
+from pydantic import BaseModel, ConfigDict, ValidationError
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from typing import List, Optional, Dict, Any, Tuple
 import asyncio
+import concurrent.futures
+import heapq
+import jinja2
 import json
+import logging
+import os
 import tempfile
+import time
 from pathlib import Path
 
 from ..core.config import ConfigManager
 from ..core.backup import BackupManager
 from ..core.restore import RestoreManager
 from ..core.scheduler import BackupScheduler
+from ..core.database import DatabaseManager, db_pool
 from ..core.models import BackupJob, DatabaseConfig, BackupConfig
 from ..utils.logger import get_logger
 
+# Prefer orjson for response encoding and config parsing when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Pydantic models for API
+
+if orjson is not None:
+    class FastJSONResponse(JSONResponse):
+        """JSON response rendered with orjson"""
+        
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+else:
+    FastJSONResponse = JSONResponse
+    _json_loads = json.loads
+
+
+# Pydantic models for API; request bodies are read-only once validated
 class DatabaseConfigModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     host: str
     port: int
     database: str
     username: str
     password: str
     ssl_mode: str = "prefer"
+    connection_timeout: int = 30
+    
+    def to_internal(self) -> DatabaseConfig:
+        """Convert to the internal dataclass without a model_dump walk"""
+        return DatabaseConfig(**self.__dict__)
 
 
 class BackupConfigModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     backup_type: str = "full"
     compression: str = "gzip"
     parallel_jobs: int = 4
     exclude_schemas: List[str] = []
     include_schemas: List[str] = []
+    
+    def to_internal(self) -> BackupConfig:
+        """Convert to the internal backup config without a model_dump walk"""
+        return BackupConfig(**self.__dict__)
 
 
 class BackupJobModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     source_config: DatabaseConfigModel
     backup_config: BackupConfigModel
@@ -47,88 +90,375 @@ class BackupJobModel(BaseModel):
     retention_days: int = 30
 
 
-def create_app(config_manager: ConfigManager) -> FastAPI:
-    """Create FastAPI application"""
+class CredentialsModel(BaseModel):
+    """Credential sections accepted by PUT /api/credentials"""
+    model_config = ConfigDict(frozen=True)
     
-    app = FastAPI(
-        title="PostgreSQL Backup & Restore Tool",
-        description="A comprehensive backup and restore solution for PostgreSQL databases",
-        version="3.0.0"
+    database: Optional[Dict[str, DatabaseConfigModel]] = None
+    source_storage: Optional[Dict[str, Any]] = None
+    target_storage: Optional[Dict[str, Any]] = None
+
+
+class BackupSettingsModel(BaseModel):
+    """The "backup" section of an imported config"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    default_type: Optional[str] = None
+    compression: Optional[str] = None
+    encryption: Optional[str] = None
+    parallel_jobs: Optional[int] = None
+    retention_days: Optional[int] = None
+    verify_backups: Optional[bool] = None
+    exclude_schemas: Optional[List[str]] = None
+    include_schemas: Optional[List[str]] = None
+    exclude_tables: Optional[List[str]] = None
+    include_tables: Optional[List[str]] = None
+    verbose: Optional[bool] = None
+    clean_before_restore: Optional[bool] = None
+    no_owner: Optional[bool] = None
+    no_privileges: Optional[bool] = None
+
+
+class SchedulerSettingsModel(BaseModel):
+    """The "scheduler" section of an imported config"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    enabled: Optional[bool] = None
+    max_concurrent_jobs: Optional[int] = None
+    job_timeout: Optional[int] = None
+    retry_attempts: Optional[int] = None
+    retry_delay: Optional[int] = None
+
+
+class WebSettingsModel(BaseModel):
+    """The "web" section of an imported config"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    host: Optional[str] = None
+    port: Optional[int] = None
+    debug: Optional[bool] = None
+    secret_key: Optional[str] = None
+    cors_origins: Optional[List[str]] = None
+    max_upload_size: Optional[int] = None
+    thread_pool_size: Optional[int] = None
+
+
+class ConfigImportModel(BaseModel):
+    """Config file accepted by POST /api/config/import; other sections are ignored"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    database: Optional[Dict[str, DatabaseConfigModel]] = None
+    backup: Optional[BackupSettingsModel] = None
+    scheduler: Optional[SchedulerSettingsModel] = None
+    web: Optional[WebSettingsModel] = None
+    
+    def to_updates(self) -> Dict[str, Any]:
+        """Flatten to dotted config paths so settings left out keep their values"""
+        updates: Dict[str, Any] = {}
+        for name, config in (self.database or {}).items():
+            updates[f"database.{name}"] = config.model_dump()
+        for section in ("backup", "scheduler", "web"):
+            settings = getattr(self, section)
+            if settings is not None:
+                for key, value in settings.model_dump(exclude_none=True).items():
+                    updates[f"{section}.{key}"] = value
+        return updates
+
+
+# Bundled web assets; checked once at import
+_TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
+_STATIC_DIR = Path(__file__).parent.parent.parent / "static"
+_HAS_TEMPLATES = _TEMPLATES_DIR.exists()
+_HAS_STATIC = _STATIC_DIR.exists()
+
+# Seconds a cached backup listing stays valid even if the directory is
+# unchanged, so files still being written report their final size
+BACKUP_SCAN_TTL = 5.0
+
+# Largest page /api/backups returns
+MAX_BACKUP_PAGE = 1000
+
+# /api/logs returns at most this many lines, read from a tail window that
+# starts at this many bytes and grows until it holds enough lines
+MAX_LOG_LINES = 1000
+LOG_TAIL_WINDOW = 64 * 1024
+
+# Concurrent /api/status polls within this window share one snapshot
+STATUS_CACHE_TTL = 0.5
+
+# Config uploads are read in chunks and rejected past the size limit
+CONFIG_UPLOAD_CHUNK = 64 * 1024
+MAX_CONFIG_UPLOAD = 1024 * 1024
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking call in the default executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+def _iter_backup_files(entries):
+    """Yield (ctime, name, size, path) for the regular files in a scandir listing"""
+    for entry in entries:
+        try:
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+        except FileNotFoundError:
+            # Removed since the directory was listed
+            continue
+        yield stat.st_ctime, entry.name, stat.st_size, entry.path
+
+
+@lru_cache(maxsize=8)
+def _scan_backup_dir(backup_dir: str, mtime_ns: int, epoch: int, count: int) -> Tuple[int, tuple]:
+    """Return the number of backup files and the newest ``count`` of them
+    
+    Cached per directory mtime and TTL epoch.
+    """
+    with os.scandir(backup_dir) as entries:
+        files = list(_iter_backup_files(entries))
+    return len(files), tuple(heapq.nlargest(count, files))
+
+
+def _list_backup_files(config_manager: ConfigManager, limit: int, offset: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """Return the total number of backup files and a page of them, newest first"""
+    backup_dir = config_manager.get_backup_dir()
+    try:
+        mtime_ns = os.stat(backup_dir).st_mtime_ns
+    except FileNotFoundError:
+        return 0, []
+    epoch = int(time.monotonic() // BACKUP_SCAN_TTL)
+    total, newest = _scan_backup_dir(str(backup_dir), mtime_ns, epoch, offset + limit)
+    
+    return total, [
+        {"name": name, "size": size, "created": ctime, "path": path}
+        for ctime, name, size, path in newest[offset:]
+    ]
+
+
+def _resolve_backup_path(config_manager: ConfigManager, backup_file: str) -> Optional[Path]:
+    """Resolve a requested backup to a file inside the backup directory
+    
+    Accepts a bare file name or a path as returned by /api/backups; returns
+    None for anything missing or outside the backup directory.
+    """
+    root = config_manager.get_backup_dir().resolve()
+    requested = Path(backup_file)
+    
+    # Listed paths are built from the configured (possibly relative) backup
+    # dir, so resolve them as given; bare names are looked up in the root
+    if requested.name == backup_file:
+        candidate = (root / requested).resolve()
+    else:
+        candidate = requested.resolve()
+    if root not in candidate.parents or not candidate.is_file():
+        return None
+    return candidate
+
+
+def _log_file_path() -> Optional[str]:
+    """Path of the file the root logger writes to, if any"""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler):
+            return handler.baseFilename
+    return None
+
+
+def _tail_lines(path: str, limit: int) -> List[bytes]:
+    """Return the last ``limit`` lines of a file, reading only its tail"""
+    if limit <= 0:
+        return []
+    
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        window = LOG_TAIL_WINDOW
+        while True:
+            offset = max(0, size - window)
+            f.seek(offset)
+            lines = f.read(size - offset).splitlines()
+            
+            # The first line is partial unless the window reached the start
+            if offset > 0:
+                lines = lines[1:]
+            if len(lines) >= limit or offset == 0:
+                return lines[-limit:]
+            window *= 2
+
+
+def _read_log_tail(path: str, limit: int) -> List[Dict[str, Any]]:
+    """Parse the newest log records written by setup_logging's file handler"""
+    try:
+        lines = _tail_lines(path, limit)
+    except FileNotFoundError:
+        return []
+    
+    logs = []
+    for raw in lines:
+        line = raw.decode("utf-8", errors="replace")
+        
+        # asctime - name - levelname - funcName:lineno - message
+        parts = line.split(" - ", 4)
+        if len(parts) == 5:
+            logs.append({"timestamp": parts[0], "level": parts[2], "message": parts[4]})
+        elif logs:
+            # Continuation of a multi-line record such as a traceback
+            logs[-1]["message"] += "\n" + line
+    return logs
+
+
+def _database_configs(section: Dict[str, Any]) -> set:
+    """Build the connection configs stored in a config "database" section"""
+    configs = set()
+    for entry in section.values():
+        try:
+            configs.add(DatabaseConfig.from_dict(entry))
+        except (TypeError, ValueError):
+            # Incomplete entries never opened a pool
+            continue
+    return configs
+
+
+@lru_cache(maxsize=32)
+def _get_db_manager(db_config: DatabaseConfig) -> DatabaseManager:
+    """Reuse one manager (and its cached server version) per connection config"""
+    return DatabaseManager(db_config)
+
+
+def _build_job(backup_job: BackupJobModel, config_manager: ConfigManager, id_prefix: str) -> BackupJob:
+    """Convert an API job model into an internal BackupJob"""
+    return BackupJob(
+        id=f"{id_prefix}_{time.time_ns()}",
+        name=backup_job.name,
+        source_config=backup_job.source_config.to_internal(),
+        backup_config=backup_job.backup_config.to_internal(),
+        backup_dir=config_manager.get_backup_dir(),
+        schedule=backup_job.schedule,
+        retention_days=backup_job.retention_days,
+        enabled=True
     )
+
+
+def create_app(config_manager: ConfigManager) -> FastAPI:
+    """Create FastAPI application"""
     
     # Initialize components
     backup_manager = BackupManager(config_manager)
     restore_manager = RestoreManager(config_manager)
     scheduler = BackupScheduler(config_manager, backup_manager)
     
-    # Setup templates and static files
-    templates_dir = Path(__file__).parent.parent.parent / "templates"
-    static_dir = Path(__file__).parent.parent.parent / "static"
+    logger = get_logger(__name__)
     
-    if templates_dir.exists():
-        templates = Jinja2Templates(directory=str(templates_dir))
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Start the scheduler on startup and clean up on shutdown"""
+        logger.info("Web application starting up")
+        
+        # The default pool (min(32, cpu + 4)) is too small for handlers that
+        # block on the disk or the database
+        pool_size = max(1, int(config_manager.get_config_value("web.thread_pool_size", 64)))
+        asyncio.get_running_loop().set_default_executor(
+            concurrent.futures.ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="pgbackup-io")
+        )
+        
+        # Reads jobs.json, so keep it off the loop
+        await _run_blocking(scheduler.load_jobs_from_config)
+        await scheduler.start()
+        try:
+            yield
+        finally:
+            logger.info("Web application shutting down")
+            await scheduler.stop()
+            await db_pool.close_all()
+    
+    app = FastAPI(
+        title="PostgreSQL Backup & Restore Tool",
+        description="A comprehensive backup and restore solution for PostgreSQL databases",
+        version="3.0.0",
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan
+    )
+    
+    # Setup templates and static files
+    if _HAS_TEMPLATES:
+        templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
+        
+        # Templates ship with the package: compile each once per process and
+        # keep the bytecode across restarts
+        templates.env.auto_reload = False
+        templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache()
     else:
         templates = None
     
-    if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    if _HAS_STATIC:
+        app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
     
-    logger = get_logger(__name__)
+    # Revisions restart at zero with the process, so tag them with
+    # the app's start time to keep ETags from earlier runs from matching
+    etag_epoch = f"{time.time_ns():x}"
     
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize application on startup"""
-        logger.info("Web application starting up")
-        scheduler.load_jobs_from_config()
-        await scheduler.start()
+    def conditional_response(request: Request, version: str, content_factory):
+        """Serve content with an ETag for its version, or 304 if the client has it"""
+        etag = f'W/"{etag_epoch}-{version}"'
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        return FastJSONResponse(
+            content=content_factory(),
+            headers={"ETag": etag, "Cache-Control": "private, max-age=1"}
+        )
+    
+    # Last /api/status snapshot and when it stops being served
+    status_cache: Dict[str, Any] = {"data": None, "expires": 0.0}
     
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        """Cleanup on shutdown"""
-        logger.info("Web application shutting down")
-        await scheduler.stop()
+    # Handlers that only read in-memory state stay plain coroutines; anything
+    # touching the disk or the database goes through _run_blocking
     
     # Routes
     @app.get("/", response_class=HTMLResponse)
     async def dashboard(request: Request):
         """Main dashboard"""
         if templates:
-            return templates.TemplateResponse("dashboard.html", {"request": request})
+            return templates.TemplateResponse(request, "dashboard.html")
         return HTMLResponse("<h1>PostgreSQL Backup & Restore Tool</h1><p>Web Interface</p>")
     
     @app.get("/api/status")
     async def get_status():
         """Get system status"""
+        now = time.monotonic()
+        if status_cache["data"] is not None and now < status_cache["expires"]:
+            return status_cache["data"]
+        
+        # The managers only read in-memory state, so the snapshot is built
+        # without awaiting and concurrent pollers cannot race on it
         stats = scheduler.get_job_stats()
         active_backups = backup_manager.get_active_backups()
         active_restores = restore_manager.get_active_restores()
         
-        return {
+        status_cache["data"] = {
             "status": "running",
             "scheduler_stats": stats,
             "active_backups": len(active_backups),
             "active_restores": len(active_restores),
             "uptime": "0:00:00"  # Would calculate actual uptime
         }
+        status_cache["expires"] = now + STATUS_CACHE_TTL
+        return status_cache["data"]
     
     @app.get("/api/backups")
-    async def list_backups():
-        """List all backup files"""
-        backup_dir = config_manager.get_backup_dir()
-        backups = []
-        
-        if backup_dir.exists():
-            for backup_file in backup_dir.glob("*"):
-                if backup_file.is_file():
-                    stat = backup_file.stat()
-                    backups.append({
-                        "name": backup_file.name,
-                        "size": stat.st_size,
-                        "created": stat.st_ctime,
-                        "path": str(backup_file)
-                    })
-        
-        return {"backups": backups}
+    async def list_backups(limit: int = 100, offset: int = 0):
+        """List backup files, newest first"""
+        limit = max(0, min(limit, MAX_BACKUP_PAGE))
+        offset = max(0, offset)
+        total, backups = await _run_blocking(_list_backup_files, config_manager, limit, offset)
+        next_offset = offset + len(backups)
+        return {
+            "backups": backups,
+            "total": total,
+            "has_more": next_offset < total,
+            "next_offset": next_offset if next_offset < total else None
+        }
     
     @app.post("/api/backup")
     async def create_backup(
@@ -137,20 +467,8 @@ def create_app(config_manager: ConfigManager) -> FastAPI:
     ):
         """Create a new backup"""
         try:
-            # Convert to internal models
-            db_config = DatabaseConfig(**backup_job.source_config.dict())
-            backup_config = BackupConfig(**backup_job.backup_config.dict())
-            
-            job = BackupJob(
-                id=f"backup_{int(asyncio.get_event_loop().time())}",
-                name=backup_job.name,
-                source_config=db_config,
-                backup_config=backup_config,
-                backup_dir=config_manager.get_backup_dir(),
-                schedule=backup_job.schedule,
-                retention_days=backup_job.retention_days,
-                enabled=True
-            )
+            # Validation and the backup dir check run off the loop
+            job = await _run_blocking(_build_job, backup_job, config_manager, "backup")
             
             # Run backup in background
             background_tasks.add_task(backup_manager.create_backup, job)
@@ -163,17 +481,17 @@ def create_app(config_manager: ConfigManager) -> FastAPI:
     
     @app.post("/api/restore")
     async def restore_database(
-        backup_file: str,
-        target_config: DatabaseConfigModel,
-        background_tasks: BackgroundTasks
+        background_tasks: BackgroundTasks,
+        backup_file: str = Body(...),
+        target_config: DatabaseConfigModel = Body(...)
     ):
         """Restore database from backup"""
         try:
-            backup_path = Path(backup_file)
-            if not backup_path.exists():
+            backup_path = await _run_blocking(_resolve_backup_path, config_manager, backup_file)
+            if backup_path is None:
                 raise HTTPException(status_code=404, detail="Backup file not found")
             
-            db_config = DatabaseConfig(**target_config.dict())
+            db_config = target_config.to_internal()
             
             # Run restore in background
             background_tasks.add_task(
@@ -184,49 +502,41 @@ def create_app(config_manager: ConfigManager) -> FastAPI:
             
             return {"message": "Restore started"}
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error starting restore: {e}")
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.get("/api/jobs")
-    async def list_jobs():
+    async def list_jobs(request: Request):
         """List scheduled jobs"""
-        jobs = scheduler.get_scheduled_jobs()
+        def build_jobs():
+            job_list = []
+            for job in scheduler.get_scheduled_jobs():
+                next_run = scheduler.get_next_run_time(job)
+                job_list.append({
+                    "id": job.id,
+                    "name": job.name,
+                    "schedule": job.schedule,
+                    "enabled": job.enabled,
+                    "next_run": next_run.isoformat() if next_run is not None else None
+                })
+            return {"jobs": job_list}
         
-        job_list = []
-        for job in jobs:
-            next_run = scheduler.get_next_run_time(job)
-            job_list.append({
-                "id": job.id,
-                "name": job.name,
-                "schedule": job.schedule,
-                "enabled": job.enabled,
-                "next_run": next_run.isoformat() if next_run is not None else None
-            })
-        
-        return {"jobs": job_list}
+        # The list comes from the scheduler, not the config, so it has its
+        # own revision
+        return conditional_response(request, f"jobs-{scheduler.revision}", build_jobs)
     
     @app.post("/api/jobs")
     async def create_job(backup_job: BackupJobModel):
         """Create a new scheduled job"""
         try:
-            # Convert to internal models
-            db_config = DatabaseConfig(**backup_job.source_config.dict())
-            backup_config = BackupConfig(**backup_job.backup_config.dict())
-            
-            job = BackupJob(
-                id=f"job_{int(asyncio.get_event_loop().time())}",
-                name=backup_job.name,
-                source_config=db_config,
-                backup_config=backup_config,
-                backup_dir=config_manager.get_backup_dir(),
-                schedule=backup_job.schedule,
-                retention_days=backup_job.retention_days,
-                enabled=True
-            )
+            # Validation and the backup dir check run off the loop
+            job = await _run_blocking(_build_job, backup_job, config_manager, "job")
             
             # Save job
-            config_manager.add_backup_job(job)
+            await _run_blocking(config_manager.add_backup_job, job)
             scheduler.add_job(job)
             
             return {"message": "Job created", "job_id": job.id}
@@ -238,37 +548,28 @@ def create_app(config_manager: ConfigManager) -> FastAPI:
     @app.get("/api/logs")
     async def get_logs(limit: int = 100):
         """Get recent logs"""
-        # This would read from actual log files
-        return {
-            "logs": [
-                {
-                    "timestamp": "2023-10-15T12:00:00Z",
-                    "level": "INFO",
-                    "message": "Backup completed successfully"
-                },
-                {
-                    "timestamp": "2023-10-15T11:58:00Z",
-                    "level": "INFO", 
-                    "message": "Starting backup"
-                }
-            ]
-        }
+        log_file = _log_file_path()
+        if log_file is None:
+            return {"logs": []}
+        
+        limit = max(0, min(limit, MAX_LOG_LINES))
+        logs = await _run_blocking(_read_log_tail, log_file, limit)
+        return {"logs": logs}
     
     @app.get("/api/config")
-    async def get_config():
+    async def get_config(request: Request):
         """Get current configuration"""
-        return {
+        return conditional_response(request, f"config-{config_manager.revision}", lambda: {
             "database": config_manager.config["database"],
             "backup": config_manager.config["backup"],
             "scheduler": config_manager.config["scheduler"]
-        }
+        })
     
     @app.put("/api/config")
     async def update_config(config_data: dict):
         """Update configuration"""
         try:
-            for key, value in config_data.items():
-                config_manager.update_config(key, value)
+            await _run_blocking(config_manager.update_many, config_data)
             return {"message": "Configuration updated"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -277,11 +578,9 @@ def create_app(config_manager: ConfigManager) -> FastAPI:
     async def test_connection(config_data: dict):
         """Test database connection"""
         try:
-            from ..core.database import DatabaseManager
-            
             if config_data.get("type") == "database":
-                db_config = DatabaseConfig(**config_data.get("config", {}))
-                db_manager = DatabaseManager(db_config)
+                db_config = DatabaseConfig.from_dict(config_data.get("config", {}))
+                db_manager = _get_db_manager(db_config)
                 
                 # Test connection
                 success, message = await db_manager.test_connection()
@@ -300,8 +599,18 @@ def create_app(config_manager: ConfigManager) -> FastAPI:
     async def export_config():
         """Export configuration as JSON"""
         try:
+            # Send the saved file as-is when it matches the in-memory config;
+            # otherwise (e.g. environment overrides, never saved) encode it
+            config_file = config_manager.get_saved_config_file()
+            if config_file is not None:
+                return FileResponse(
+                    config_file,
+                    media_type="application/json",
+                    filename="postgres-backup-config.json"
+                )
+            
             config = config_manager.get_full_config()
-            return JSONResponse(
+            return FastJSONResponse(
                 content=config,
                 headers={
                     "Content-Disposition": "attachment; filename=postgres-backup-config.json"
@@ -317,41 +626,71 @@ def create_app(config_manager: ConfigManager) -> FastAPI:
             if file.filename and not file.filename.endswith('.json'):
                 raise HTTPException(status_code=400, detail="Only JSON files are supported")
             
-            content = await file.read()
-            config_data = json.loads(content.decode('utf-8'))
+            content = bytearray()
+            while chunk := await file.read(CONFIG_UPLOAD_CHUNK):
+                content.extend(chunk)
+                if len(content) > MAX_CONFIG_UPLOAD:
+                    raise HTTPException(status_code=413, detail="Configuration file too large")
+            
+            # Both parsers accept bytes directly
+            config_data = ConfigImportModel.model_validate(_json_loads(content)).to_updates()
             
             # Validate and import configuration
-            for key, value in config_data.items():
-                config_manager.update_config(key, value)
+            await _run_blocking(config_manager.update_many, config_data)
             
             return {"message": "Configuration imported successfully"}
-        except json.JSONDecodeError:
+        except HTTPException:
+            raise
+        except (json.JSONDecodeError, UnicodeDecodeError):
             raise HTTPException(status_code=400, detail="Invalid JSON file")
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid configuration: {e.error_count()} invalid value(s)")
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.get("/api/credentials")
-    async def get_credentials():
+    async def get_credentials(request: Request):
         """Get all credential configurations"""
         try:
-            config = config_manager.get_full_config()
-            return {
+            config = config_manager.config
+            return conditional_response(request, f"config-{config_manager.revision}", lambda: {
                 "database": config.get("database", {}),
                 "source_storage": config.get("source_storage", {}),
                 "target_storage": config.get("target_storage", {})
-            }
+            })
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.put("/api/credentials")
-    async def update_credentials(credentials: dict):
+    async def update_credentials(credentials: CredentialsModel):
         """Update credential configurations"""
         try:
-            for cred_type, config in credentials.items():
-                if cred_type in ["database", "source_storage", "target_storage"]:
-                    config_manager.update_config(cred_type, config)
+            # Sections left out of the request keep their current values
+            updates = {
+                cred_type: config for cred_type, config in credentials.model_dump().items()
+                if config is not None
+            }
+            previous = _database_configs(config_manager.config.get("database", {}))
+            await _run_blocking(config_manager.update_many, updates)
+            _get_db_manager.cache_clear()
+            
+            # Drop pools whose connections were opened with replaced credentials
+            current = _database_configs(config_manager.config.get("database", {}))
+            for stale_config in previous - current:
+                await db_pool.close_pools_for(stale_config)
+            
             return {"message": "Credentials updated successfully"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
-    return app
\ No newline at end of file
+    return app
+
+
+def create_default_app() -> FastAPI:
+    """Create the app from the default config, as an app factory for uvicorn
+    
+    Multi-worker deployments run e.g.
+    ``uvicorn --factory src.web.app:create_default_app --workers 4``;
+    web.thread_pool_size applies per worker.
+    """
+    return create_app(ConfigManager())
@@ -160,25 +160,30 @@ function updateSystemStatus(status) {
     }
 }
 
-async function loadBackups() {
+async function loadBackups(offset = 0) {
     try {
-        const data = await apiCall('/api/backups');
-        displayBackups(data.backups);
+        const data = await apiCall(`/api/backups?offset=${offset}`);
+        displayBackups(data, offset > 0);
     } catch (error) {
         console.error('Failed to load backups:', error);
     }
 }
 
-function displayBackups(backups) {
+function displayBackups(data, append = false) {
     const container = document.getElementById('backups-list');
     if (!container) return;
     
-    if (backups.length === 0) {
+    const backups = data.backups;
+    if (backups.length === 0 && !append) {
         container.innerHTML = '<p class="text-gray-500">No backups found</p>';
         return;
     }
     
-    container.innerHTML = backups.map(backup => `
+    // Drop the previous page's "Load more" control before adding rows
+    const moreButton = document.getElementById('backups-load-more');
+    if (moreButton) moreButton.remove();
+    
+    const rows = backups.map(backup => `
         <div class="border rounded p-3 mb-2">
             <div class="flex justify-between items-center">
                 <div>
@@ -197,6 +202,21 @@ function displayBackups(backups) {
             </div>
         </div>
     `).join('');
+    
+    if (append) {
+        container.insertAdjacentHTML('beforeend', rows);
+    } else {
+        container.innerHTML = rows;
+    }
+    
+    if (data.has_more) {
+        const shown = data.next_offset;
+        container.insertAdjacentHTML('beforeend', `
+            <button id="backups-load-more" onclick="loadBackups(${shown})" class="w-full border rounded p-2 text-sm text-gray-600 hover:bg-gray-100">
+                Load more (${shown} of ${data.total} shown)
+            </button>
+        `);
+    }
 }
 
 async function loadLogs() {